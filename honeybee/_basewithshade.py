@@ -232,10 +232,10 @@ class _BaseWithShade(_Base):
                 X/Y axes of the plane but is not required and can be removed to
                 keep the dictionary smaller. (Default: True).
         """
-        if self._outdoor_shades != []:
+        if self._outdoor_shades:
             base['outdoor_shades'] = [shd.to_dict(abridged, included_prop, include_plane)
                                       for shd in self._outdoor_shades]
-        if self._indoor_shades != []:
+        if self._indoor_shades:
             base['indoor_shades'] = [shd.to_dict(abridged, included_prop, include_plane)
                                      for shd in self._indoor_shades]
 
@@ -266,13 +266,17 @@ class _BaseWithShade(_Base):
 
     def _duplicate_child_shades(self, new_object):
         """Add duplicated child shades to a duplicated new_object."""
-        new_object._outdoor_shades = [oshd.duplicate() for oshd in self._outdoor_shades]
-        new_object._indoor_shades = [ishd.duplicate() for ishd in self._indoor_shades]
-        for oshd in new_object._outdoor_shades:
-            oshd._parent = new_object
-        for ishd in new_object._indoor_shades:
-            ishd._parent = new_object
-            ishd._is_indoor = True
+        new_object._outdoor_shades = outdoor_shades = []
+        for oshd in self._outdoor_shades:
+            new_shd = oshd.duplicate()
+            new_shd._parent = new_object
+            outdoor_shades.append(new_shd)
+        new_object._indoor_shades = indoor_shades = []
+        for ishd in self._indoor_shades:
+            new_shd = ishd.duplicate()
+            new_shd._parent = new_object
+            new_shd._is_indoor = True
+            indoor_shades.append(new_shd)
 
     def _min_with_shades(self, geometry):
         """Calculate min Point3D around this object's geometry and its shades."""
@@ -37,13 +37,10 @@ def check_duplicate_identifiers(
     if len(dup) != 0:
         if detailed:
             # find the object display names
-            dis_names = []
-            for obj_id in dup:
-                dis_name = None
-                for obj in objects_to_check:
-                    if obj.identifier == obj_id:
-                        dis_name = obj.display_name
-                dis_names.append(dis_name)
+            dup_set = set(dup)
+            dis_name_dict = {obj.identifier: obj.display_name
+                             for obj in objects_to_check if obj.identifier in dup_set}
+            dis_names = [dis_name_dict[obj_id] for obj_id in dup]
             err_list = []
             for dup_id, dis_name in zip(dup, dis_names):
                 msg = 'There is a duplicated {} identifier: {}'.format(obj_name, dup_id)
@@ -103,21 +100,26 @@ def check_duplicate_identifiers_parent(
     obj_id_iter = (obj.identifier for obj in objects_to_check)
     dup = [t for t, c in collections.Counter(obj_id_iter).items() if c > 1]
     if len(dup) != 0:
+        # group the duplicated objects by identifier in a single pass
+        dup_objs = {obj_id: [] for obj_id in dup}
+        for obj in objects_to_check:
+            try:
+                dup_objs[obj.identifier].append(obj)
+            except KeyError:  # not a duplicated object
+                pass
         # find the relevant top-level parents
         top_par, dis_names = [], []
         for obj_id in dup:
-            rel_parents, dis_name = [], None
-            for obj in objects_to_check:
-                if obj.identifier == obj_id:
-                    dis_name = obj.display_name
-                    if obj.has_parent:
-                        try:
-                            par_obj = obj.top_level_parent
-                        except AttributeError:
-                            par_obj = obj.parent
-                        rel_parents.append(par_obj)
+            rel_parents = []
+            for obj in dup_objs[obj_id]:
+                if obj.has_parent:
+                    try:
+                        par_obj = obj.top_level_parent
+                    except AttributeError:
+                        par_obj = obj.parent
+                    rel_parents.append(par_obj)
             top_par.append(rel_parents)
-            dis_names.append(dis_name)
+            dis_names.append(dup_objs[obj_id][-1].display_name)
         # if a detailed dictionary is requested, then create it
         if detailed:
             err_list = []
@@ -2,6 +2,8 @@
 """Honeybee Face."""
 from __future__ import division
 import math
+from bisect import bisect_right
+from itertools import chain
 
 from ladybug_geometry.geometry2d import Vector2D, Point2D, Polygon2D, Mesh2D
 from ladybug_geometry.geometry3d import Vector3D, Point3D, Plane, Face3D
@@ -19,6 +21,22 @@ from .door import Door
 import honeybee.boundarycondition as hbc
 import honeybee.writer.face as writer
 
+_CARDINAL_TEXT = ('North', 'NorthEast', 'East', 'SouthEast', 'South',
+                  'SouthWest', 'West', 'NorthWest')
+_CARDINAL_ANGLES = (22.5, 67.5, 112.5, 157.5, 202.5, 247.5, 292.5, 337.5)
+_INTERIOR_TYPE_NAMES = {
+    'Wall': 'InteriorWall',
+    'RoofCeiling': 'InteriorRoofCeiling',
+    'Floor': 'InteriorFloor',
+    'AirBoundary': 'InteriorAirBoundary'
+}
+
+
+def _distance_sqr(pt_1, pt_2):
+    """Get the squared distance between two Point3Ds without a square root."""
+    dx, dy, dz = pt_1.x - pt_2.x, pt_1.y - pt_2.y, pt_1.z - pt_2.z
+    return dx * dx + dy * dy + dz * dz
+
 
 class Face(_BaseWithShade):
     """A single planar face.
@@ -72,7 +90,7 @@ class Face(_BaseWithShade):
         * user_data
     """
     TYPES = face_types
-    __slots__ = ('_geometry', '_parent', '_punched_geometry',
+    __slots__ = ('_geometry', '_parent', '_punched_geometry', '_upper_left_verts',
                  '_apertures', '_doors', '_type', '_boundary_condition')
     TYPE_COLORS = {
         'Wall': Color(230, 180, 60),
@@ -103,6 +121,7 @@ class Face(_BaseWithShade):
         self._parent = None  # _parent will be set when the Face is added to a Room
         # initialize with no apertures/doors (they can be assigned later)
         self._punched_geometry = None
+        self._upper_left_verts = None
         self._apertures = []
         self._doors = []
 
@@ -203,7 +222,7 @@ class Face(_BaseWithShade):
     def type(self, value):
         assert value in self.TYPES, '{} is not a valid face type.'.format(value)
         if isinstance(value, AirBoundary):
-            assert self._apertures == [] or self._doors == [], \
+            assert not self._apertures and not self._doors, \
                 '{} cannot be assigned to a Face with Apertures or Doors.'.format(value)
         self.properties.reset_to_default()  # reset constructions/modifiers
         self._type = value
@@ -218,7 +237,7 @@ class Face(_BaseWithShade):
     def boundary_condition(self, value):
         assert isinstance(value, _BoundaryCondition), \
             'Expected BoundaryCondition. Got {}'.format(type(value))
-        if self._apertures != [] or self._doors != []:
+        if self._apertures or self._doors:
             assert isinstance(value, (Outdoors, Surface)), \
                 '{} cannot be assigned to a Face with apertures or doors.'.format(value)
         self._boundary_condition = value
@@ -236,7 +255,7 @@ class Face(_BaseWithShade):
     @property
     def sub_faces(self):
         """Get a tuple of apertures and doors in this Face."""
-        return tuple(self._apertures + self._doors)
+        return tuple(chain(self._apertures, self._doors))
 
     @property
     def parent(self):
@@ -251,14 +270,14 @@ class Face(_BaseWithShade):
     @property
     def has_sub_faces(self):
         """Get a boolean noting whether this Face has Apertures or Doors."""
-        return not (self._apertures == [] and self._doors == [])
+        return bool(self._apertures or self._doors)
 
     @property
     def can_be_ground(self):
         """Get a boolean for whether this Face can support a Ground boundary condition.
         """
-        return self._apertures == [] and self._doors == [] \
-            and not isinstance(self._type, AirBoundary)
+        return not self._apertures and not self._doors \
+            and type(self._type) is not AirBoundary
 
     @property
     def geometry(self):
@@ -273,13 +292,13 @@ class Face(_BaseWithShade):
     def punched_geometry(self):
         """Get a Face3D object with holes cut in it for apertures and doors.
         """
+        if not self._apertures and not self._doors:
+            return self._geometry  # no holes to cut; avoid caching a stale alias
         if self._punched_geometry is None:
-            _sub_faces = tuple(sub_f.geometry for sub_f in self._apertures + self._doors)
-            if len(_sub_faces) != 0:
-                self._punched_geometry = Face3D.from_punched_geometry(
-                    self._geometry, _sub_faces)
-            else:
-                self._punched_geometry = self._geometry
+            _sub_faces = tuple(
+                sub_f._geometry for sub_f in chain(self._apertures, self._doors))
+            self._punched_geometry = Face3D.from_punched_geometry(
+                self._geometry, _sub_faces)
         return self._punched_geometry
 
     @property
@@ -309,7 +328,12 @@ class Face(_BaseWithShade):
         from the upper-left-most vertex.  This property should be used when exporting to
         EnergyPlus / OpenStudio.
         """
-        return self._geometry.upper_left_counter_clockwise_vertices
+        # the vertices are stored with the Face3D they came from so that any
+        # replacement of the geometry automatically invalidates them
+        geo = self._geometry
+        if self._upper_left_verts is None or self._upper_left_verts[0] is not geo:
+            self._upper_left_verts = (geo, geo.upper_left_counter_clockwise_vertices)
+        return self._upper_left_verts[1]
 
     @property
     def normal(self):
@@ -340,31 +364,25 @@ class Face(_BaseWithShade):
     @property
     def min(self):
         """Get a Point3D for the minimum of the bounding box around the object."""
-        all_geo = self._outdoor_shades + self._indoor_shades
-        all_geo.extend(self._apertures)
-        all_geo.extend(self._doors)
-        all_geo.append(self.geometry)
-        return self._calculate_min(all_geo)
+        return self._calculate_min(self._bounding_objects())
 
     @property
     def max(self):
         """Get a Point3D for the maximum of the bounding box around the object."""
-        all_geo = self._outdoor_shades + self._indoor_shades
-        all_geo.extend(self._apertures)
-        all_geo.extend(self._doors)
-        all_geo.append(self.geometry)
-        return self._calculate_max(all_geo)
+        return self._calculate_max(self._bounding_objects())
 
     @property
     def aperture_area(self):
         """Get the combined area of the face's apertures."""
-        return sum([ap.area for ap in self._apertures])
+        if not self._apertures:
+            return 0
+        return sum(ap._geometry.area for ap in self._apertures)
 
     @property
     def aperture_ratio(self):
         """Get a number between 0 and 1 for the area ratio of the apertures to the face.
         """
-        return self.aperture_area / self.area
+        return self.aperture_area / self._geometry.area
 
     @property
     def tilt(self):
@@ -389,20 +407,20 @@ class Face(_BaseWithShade):
     def is_exterior(self):
         """Get a boolean for whether this object has an Outdoors boundary condition.
         """
-        return isinstance(self.boundary_condition, Outdoors)
+        return isinstance(self._boundary_condition, Outdoors)
 
     @property
     def type_color(self):
         """Get a Color to be used in visualizations by type."""
-        ts = self.type.name if isinstance(self.boundary_condition, (Outdoors, Ground)) \
-            else 'Interior{}'.format(self.type.name)
+        ts = self._type.name if isinstance(self._boundary_condition, (Outdoors, Ground)) \
+            else _INTERIOR_TYPE_NAMES[self._type.name]
         return self.TYPE_COLORS[ts]
 
     @property
     def bc_color(self):
         """Get a Color to be used in visualizations by boundary condition."""
         try:
-            return self.BC_COLORS[self.boundary_condition.name]
+            return self.BC_COLORS[self._boundary_condition.name]
         except KeyError:  # extension boundary condition
             return self.BC_COLORS['Other']
 
@@ -415,8 +433,9 @@ class Face(_BaseWithShade):
             north_vector: A ladybug_geometry Vector2D for the north direction.
                 Default is the Y-axis (0, 1).
         """
+        normal = self._geometry.normal
         return math.degrees(
-            north_vector.angle_clockwise(Vector2D(self.normal.x, self.normal.y)))
+            north_vector.angle_clockwise(Vector2D(normal.x, normal.y)))
 
     def cardinal_direction(self, north_vector=Vector2D(0, 1)):
         """Get text description for the cardinal direction that the face is pointing.
@@ -429,13 +448,7 @@ class Face(_BaseWithShade):
                 Default is the Y-axis (0, 1).
         """
         orient = self.horizontal_orientation(north_vector)
-        orient_text = ('North', 'NorthEast', 'East', 'SouthEast', 'South',
-                       'SouthWest', 'West', 'NorthWest')
-        angles = (22.5, 67.5, 112.5, 157.5, 202.5, 247.5, 292.5, 337.5)
-        for i, ang in enumerate(angles):
-            if orient < ang:
-                return orient_text[i]
-        return orient_text[0]
+        return _CARDINAL_TEXT[bisect_right(_CARDINAL_ANGLES, orient) % 8]
 
     def add_prefix(self, prefix):
         """Change the identifier of this object and child objects by inserting a prefix.
@@ -451,17 +464,16 @@ class Face(_BaseWithShade):
                 that this prefix be short to avoid maxing out the 100 allowable
                 characters for honeybee identifiers.
         """
-        self._identifier = clean_string('{}_{}'.format(prefix, self.identifier))
-        self.display_name = '{}_{}'.format(prefix, self.display_name)
+        pre_str = '{}_'.format(prefix)
+        self._identifier = clean_string(pre_str + self.identifier)
+        self.display_name = pre_str + self.display_name
         self.properties.add_prefix(prefix)
-        for ap in self._apertures:
-            ap.add_prefix(prefix)
-        for dr in self._doors:
-            dr.add_prefix(prefix)
+        for sub_f in chain(self._apertures, self._doors):
+            sub_f.add_prefix(prefix)
         self._add_prefix_shades(prefix)
         if isinstance(self._boundary_condition, Surface):
-            new_bc_objs = (clean_string('{}_{}'.format(prefix, adj_name)) for adj_name
-                           in self._boundary_condition._boundary_condition_objects)
+            new_bc_objs = [clean_string(pre_str + adj_name) for adj_name
+                           in self._boundary_condition._boundary_condition_objects]
             self._boundary_condition = Surface(new_bc_objs, False)
 
     def remove_sub_faces(self):
@@ -478,7 +490,7 @@ class Face(_BaseWithShade):
 
     def remove_doors(self):
         """Remove all doors from the face."""
-        for door in self._apertures:
+        for door in self._doors:
             door._parent = None
         self._doors = []
         self._punched_geometry = None  # reset so that it can be re-computed
@@ -498,11 +510,7 @@ class Face(_BaseWithShade):
         assert isinstance(aperture, Aperture), \
             'Expected Aperture. Got {}.'.format(type(aperture))
         self._acceptable_sub_face_check(Aperture)
-        aperture._parent = self
-        if self.normal.angle(aperture.normal) > math.pi / 2:  # reversed normal
-            aperture._geometry = aperture._geometry.flip()
-        self._apertures.append(aperture)
-        self._punched_geometry = None  # reset so that it can be re-computed
+        self._parent_sub_faces((aperture,), self._apertures)
 
     def add_door(self, door):
         """Add a Door to this face.
@@ -519,11 +527,7 @@ class Face(_BaseWithShade):
         assert isinstance(door, Door), \
             'Expected Door. Got {}.'.format(type(door))
         self._acceptable_sub_face_check(Door)
-        door._parent = self
-        if self.normal.angle(door.normal) > math.pi / 2:  # reversed normal
-            door._geometry = door._geometry.flip()
-        self._doors.append(door)
-        self._punched_geometry = None  # reset so that it can be re-computed
+        self._parent_sub_faces((door,), self._doors)
 
     def add_sub_face(self, sub_face):
         """Add an Apertures or Doors to this face."""
@@ -534,13 +538,25 @@ class Face(_BaseWithShade):
 
     def add_apertures(self, apertures):
         """Add a list of Apertures to this face."""
+        apertures = tuple(apertures)
+        if len(apertures) == 0:
+            return
         for aperture in apertures:
-            self.add_aperture(aperture)
+            assert isinstance(aperture, Aperture), \
+                'Expected Aperture. Got {}.'.format(type(aperture))
+        self._acceptable_sub_face_check(Aperture)
+        self._parent_sub_faces(apertures, self._apertures)
 
     def add_doors(self, doors):
         """Add a list of Doors to this face."""
+        doors = tuple(doors)
+        if len(doors) == 0:
+            return
         for door in doors:
-            self.add_door(door)
+            assert isinstance(door, Door), \
+                'Expected Door. Got {}.'.format(type(door))
+        self._acceptable_sub_face_check(Door)
+        self._parent_sub_faces(doors, self._doors)
 
     def add_sub_faces(self, sub_faces):
         """Add a list of Apertures and/or Doors to this face."""
@@ -599,11 +615,14 @@ class Face(_BaseWithShade):
                 msg = '{} Relevant rooms: {}, {}'.format(
                     msg, self.parent.display_name, other_face.parent.display_name)
             raise AssertionError(msg)
+        tol_sqr = tolerance * tolerance
         if len(self._apertures) > 0:
             found_adjacencies = 0
+            other_cents = [ap._geometry.center for ap in other_face._apertures]
             for aper_1 in self._apertures:
-                for aper_2 in other_face._apertures:
-                    if aper_1.center.distance_to_point(aper_2.center) <= tolerance:
+                cent_1 = aper_1._geometry.center
+                for aper_2, cent_2 in zip(other_face._apertures, other_cents):
+                    if _distance_sqr(cent_1, cent_2) <= tol_sqr:
                         aper_1.set_adjacency(aper_2)
                         adj_info['adjacent_apertures'].append((aper_1, aper_2))
                         found_adjacencies += 1
@@ -622,9 +641,11 @@ class Face(_BaseWithShade):
                 self.display_name, other_face.display_name)
         if len(self._doors) > 0:
             found_adjacencies = 0
+            other_cents = [dr._geometry.center for dr in other_face._doors]
             for door_1 in self._doors:
-                for door_2 in other_face._doors:
-                    if door_1.center.distance_to_point(door_2.center) <= tolerance:
+                cent_1 = door_1._geometry.center
+                for door_2, cent_2 in zip(other_face._doors, other_cents):
+                    if _distance_sqr(cent_1, cent_2) <= tol_sqr:
                         door_1.set_adjacency(door_2)
                         adj_info['adjacent_doors'].append((door_1, door_2))
                         found_adjacencies += 1
@@ -1219,9 +1240,9 @@ class Face(_BaseWithShade):
             ap_faces = geo.sub_faces_by_ratio_rectangle(ratio, tolerance)
         else:
             ap_faces = geo.sub_faces_by_ratio(ratio)
-        for i, ap_face in enumerate(ap_faces):
-            aperture = Aperture('{}_Glz{}'.format(self.identifier, i), ap_face)
-            self.add_aperture(aperture)
+        glz_base = '{}_Glz'.format(self.identifier)
+        self.add_apertures(
+            Aperture(glz_base + str(i), ap_face) for i, ap_face in enumerate(ap_faces))
 
     def apertures_by_ratio_rectangle(self, ratio, aperture_height, sill_height,
                                      horizontal_separation, vertical_separation=0,
@@ -1276,9 +1297,9 @@ class Face(_BaseWithShade):
         ap_faces = geo.sub_faces_by_ratio_sub_rectangle(
             ratio, aperture_height, sill_height, horizontal_separation,
             vertical_separation, tolerance)
-        for i, ap_face in enumerate(ap_faces):
-            aperture = Aperture('{}_Glz{}'.format(self.identifier, i), ap_face)
-            self.add_aperture(aperture)
+        glz_base = '{}_Glz'.format(self.identifier)
+        self.add_apertures(
+            Aperture(glz_base + str(i), ap_face) for i, ap_face in enumerate(ap_faces))
 
     def apertures_by_ratio_gridded(self, ratio, x_dim, y_dim=None, tolerance=0.01):
         """Add apertures to this face given a ratio of aperture area to face area.
@@ -1321,9 +1342,9 @@ class Face(_BaseWithShade):
         except AssertionError:  # degenerate face that should not have apertures
             return
         ap_faces = geo.sub_faces_by_ratio_gridded(ratio, x_dim, y_dim)
-        for i, ap_face in enumerate(ap_faces):
-            aperture = Aperture('{}_Glz{}'.format(self.identifier, i), ap_face)
-            self.add_aperture(aperture)
+        glz_base = '{}_Glz'.format(self.identifier)
+        self.add_apertures(
+            Aperture(glz_base + str(i), ap_face) for i, ap_face in enumerate(ap_faces))
 
     def apertures_by_width_height_rectangle(self, aperture_height, aperture_width,
                                             sill_height, horizontal_separation,
@@ -1371,9 +1392,9 @@ class Face(_BaseWithShade):
         ap_faces = geo.sub_faces_by_dimension_rectangle(
             aperture_height, aperture_width, sill_height, horizontal_separation,
             tolerance)
-        for i, ap_face in enumerate(ap_faces):
-            aperture = Aperture('{}_Glz{}'.format(self.identifier, i), ap_face)
-            self.add_aperture(aperture)
+        glz_base = '{}_Glz'.format(self.identifier)
+        self.add_apertures(
+            Aperture(glz_base + str(i), ap_face) for i, ap_face in enumerate(ap_faces))
 
     def aperture_by_width_height(self, width, height, sill_height=1,
                                  aperture_identifier=None):
@@ -1429,7 +1450,7 @@ class Face(_BaseWithShade):
         ap_verts2d = (lower_left, lower_right, upper_right, upper_left)
         ap_verts3d = tuple(face_plane.xy_to_xyz(pt) for pt in ap_verts2d)
         ap_face = Face3D(ap_verts3d, self._geometry.plane)
-        if self.normal.angle(ap_face.normal) > math.pi / 2:  # reversed normal
+        if self._geometry.normal.dot(ap_face.normal) < 0:  # reversed normal
             ap_face = ap_face.flip()
 
         # Create the aperture and add it to this Face
@@ -1553,17 +1574,15 @@ class Face(_BaseWithShade):
         """
         assert louver_count > 0, 'louver_count must be greater than 0.'
         angle = math.radians(angle)
-        louvers = []
-        face_geo = self.geometry if indoor is False else self.geometry.flip()
+        face_geo = self._geometry if indoor is False else self._geometry.flip()
         if base_name is None:
-            shd_name_base = '{}_InShd{}' if indoor else '{}_OutShd{}'
-        else:
-            shd_name_base = '{}_' + str(base_name) + '{}'
+            base_name = 'InShd' if indoor else 'OutShd'
+        shd_name_base = '{}_{}'.format(self.identifier, base_name)
         shade_faces = face_geo.contour_fins_by_number(
             louver_count, depth, offset, angle,
             contour_vector, flip_start_side, tolerance)
-        for i, shade_geo in enumerate(shade_faces):
-            louvers.append(Shade(shd_name_base.format(self.identifier, i), shade_geo))
+        louvers = [Shade(shd_name_base + str(i), shade_geo)
+                   for i, shade_geo in enumerate(shade_faces)]
         if indoor:
             self.add_indoor_shades(louvers)
         else:
@@ -1607,11 +1626,10 @@ class Face(_BaseWithShade):
         """
         # set defaults
         angle = math.radians(angle)
-        face_geo = self.geometry if indoor is False else self.geometry.flip()
+        face_geo = self._geometry if indoor is False else self._geometry.flip()
         if base_name is None:
-            shd_name_base = '{}_InShd{}' if indoor else '{}_OutShd{}'
-        else:
-            shd_name_base = '{}_' + str(base_name) + '{}'
+            base_name = 'InShd' if indoor else 'OutShd'
+        shd_name_base = '{}_{}'.format(self.identifier, base_name)
 
         # generate shade geometries
         shade_faces = face_geo.contour_fins_by_distance_between(
@@ -1623,9 +1641,8 @@ class Face(_BaseWithShade):
                 pass
 
         # create the shade objects
-        louvers = []
-        for i, shade_geo in enumerate(shade_faces):
-            louvers.append(Shade(shd_name_base.format(self.identifier, i), shade_geo))
+        louvers = [Shade(shd_name_base + str(i), shade_geo)
+                   for i, shade_geo in enumerate(shade_faces)]
         if indoor:
             self.add_indoor_shades(louvers)
         else:
@@ -1639,14 +1656,15 @@ class Face(_BaseWithShade):
             moving_vec: A ladybug_geometry Vector3D with the direction and distance
                 to move the face.
         """
-        self._geometry = self.geometry.move(moving_vec)
-        for ap in self._apertures:
-            ap.move(moving_vec)
-        for dr in self._doors:
-            dr.move(moving_vec)
+        punched_geo = self._punched_geometry  # transform instead of recomputing
+        self._geometry = self._geometry.move(moving_vec)
+        if self._apertures or self._doors:
+            for sub_f in chain(self._apertures, self._doors):
+                sub_f.move(moving_vec)
         self.move_shades(moving_vec)
         self.properties.move(moving_vec)
-        self._punched_geometry = None  # reset so that it can be re-computed
+        self._punched_geometry = punched_geo.move(moving_vec) \
+            if punched_geo is not None else None
 
     def rotate(self, axis, angle, origin):
         """Rotate this Face by a certain angle around an axis and origin.
@@ -1657,14 +1675,15 @@ class Face(_BaseWithShade):
             origin: A ladybug_geometry Point3D for the origin around which the
                 object will be rotated.
         """
-        self._geometry = self.geometry.rotate(axis, math.radians(angle), origin)
-        for ap in self._apertures:
-            ap.rotate(axis, angle, origin)
-        for dr in self._doors:
-            dr.rotate(axis, angle, origin)
+        punched_geo, rad_angle = self._punched_geometry, math.radians(angle)
+        self._geometry = self._geometry.rotate(axis, rad_angle, origin)
+        if self._apertures or self._doors:
+            for sub_f in chain(self._apertures, self._doors):
+                sub_f.rotate(axis, angle, origin)
         self.rotate_shades(axis, angle, origin)
         self.properties.rotate(axis, angle, origin)
-        self._punched_geometry = None  # reset so that it can be re-computed
+        self._punched_geometry = punched_geo.rotate(axis, rad_angle, origin) \
+            if punched_geo is not None else None
 
     def rotate_xy(self, angle, origin):
         """Rotate this Face counterclockwise in the world XY plane by a certain angle.
@@ -1674,14 +1693,15 @@ class Face(_BaseWithShade):
             origin: A ladybug_geometry Point3D for the origin around which the
                 object will be rotated.
         """
-        self._geometry = self.geometry.rotate_xy(math.radians(angle), origin)
-        for ap in self._apertures:
-            ap.rotate_xy(angle, origin)
-        for dr in self._doors:
-            dr.rotate_xy(angle, origin)
+        punched_geo, rad_angle = self._punched_geometry, math.radians(angle)
+        self._geometry = self._geometry.rotate_xy(rad_angle, origin)
+        if self._apertures or self._doors:
+            for sub_f in chain(self._apertures, self._doors):
+                sub_f.rotate_xy(angle, origin)
         self.rotate_xy_shades(angle, origin)
         self.properties.rotate_xy(angle, origin)
-        self._punched_geometry = None  # reset so that it can be re-computed
+        self._punched_geometry = punched_geo.rotate_xy(rad_angle, origin) \
+            if punched_geo is not None else None
 
     def reflect(self, plane):
         """Reflect this Face across a plane.
@@ -1690,14 +1710,15 @@ class Face(_BaseWithShade):
             plane: A ladybug_geometry Plane across which the object will
                 be reflected.
         """
-        self._geometry = self.geometry.reflect(plane.n, plane.o)
-        for ap in self._apertures:
-            ap.reflect(plane)
-        for dr in self._doors:
-            dr.reflect(plane)
+        punched_geo = self._punched_geometry  # transform instead of recomputing
+        self._geometry = self._geometry.reflect(plane.n, plane.o)
+        if self._apertures or self._doors:
+            for sub_f in chain(self._apertures, self._doors):
+                sub_f.reflect(plane)
         self.reflect_shades(plane)
         self.properties.reflect(plane)
-        self._punched_geometry = None  # reset so that it can be re-computed
+        self._punched_geometry = punched_geo.reflect(plane.n, plane.o) \
+            if punched_geo is not None else None
 
     def scale(self, factor, origin=None):
         """Scale this Face by a factor from an origin point.
@@ -1707,14 +1728,15 @@ class Face(_BaseWithShade):
             origin: A ladybug_geometry Point3D representing the origin from which
                 to scale. If None, it will be scaled from the World origin (0, 0, 0).
         """
-        self._geometry = self.geometry.scale(factor, origin)
-        for ap in self._apertures:
-            ap.scale(factor, origin)
-        for dr in self._doors:
-            dr.scale(factor, origin)
+        punched_geo = self._punched_geometry  # transform instead of recomputing
+        self._geometry = self._geometry.scale(factor, origin)
+        if self._apertures or self._doors:
+            for sub_f in chain(self._apertures, self._doors):
+                sub_f.scale(factor, origin)
         self.scale_shades(factor, origin)
         self.properties.scale(factor, origin)
-        self._punched_geometry = None  # reset so that it can be re-computed
+        self._punched_geometry = punched_geo.scale(factor, origin) \
+            if punched_geo is not None else None
 
     def remove_colinear_vertices(self, tolerance=0.01):
         """Remove all colinear and duplicate vertices from this object's geometry.
@@ -1727,7 +1749,7 @@ class Face(_BaseWithShade):
                 suitable for objects in meters.
         """
         try:
-            self._geometry = self.geometry.remove_colinear_vertices(tolerance)
+            self._geometry = self._geometry.remove_colinear_vertices(tolerance)
         except AssertionError as e:  # usually a sliver face of some kind
             raise ValueError(
                 'Face "{}" is invalid with dimensions less than the '
@@ -1742,16 +1764,9 @@ class Face(_BaseWithShade):
                 at which point the vertex is considered colinear. Default: 0.01,
                 suitable for objects in meters.
         """
-        for i, ap in enumerate(self._apertures):
-            try:
-                ap.remove_colinear_vertices(tolerance)
-            except ValueError:
-                self._apertures.pop(i)
-        for i, dr in enumerate(self._doors):
-            try:
-                dr.remove_colinear_vertices(tolerance)
-            except ValueError:
-                self._apertures.pop(i)
+        self._apertures = self._remove_degenerate(self._apertures, tolerance)
+        self._doors = self._remove_degenerate(self._doors, tolerance)
+        self._punched_geometry = None  # reset so that it can be re-computed
 
     def is_geo_equivalent(self, face, tolerance=0.01):
         """Get a boolean for whether this object is geometrically equivalent to another.
@@ -1771,14 +1786,15 @@ class Face(_BaseWithShade):
         meta_2 = (face.display_name, face.type, face.boundary_condition)
         if meta_1 != meta_2:
             return False
-        if abs(self.area - face.area) > tolerance * self.area:
-            return False
-        if not self.geometry.is_centered_adjacent(face.geometry, tolerance):
-            return False
         if len(self._apertures) != len(face._apertures):
             return False
         if len(self._doors) != len(face._doors):
             return False
+        area = self._geometry.area
+        if abs(area - face._geometry.area) > tolerance * area:
+            return False
+        if not self._geometry.is_centered_adjacent(face._geometry, tolerance):
+            return False
         for ap1, ap2 in zip(self._apertures, face._apertures):
             if not ap1.is_geo_equivalent(ap2, tolerance):
                 return False
@@ -1842,10 +1858,13 @@ class Face(_BaseWithShade):
             A string with the message or a list with dictionaries if detailed is True.
         """
         detailed = False if raise_exception else detailed
+        if not self._apertures:
+            return [] if detailed else ''
         angle_tolerance = math.radians(angle_tolerance)
+        parent_geo = self._geometry
         msgs = []
         for ap in self._apertures:
-            if not self.geometry.is_sub_face(ap.geometry, tolerance, angle_tolerance):
+            if not parent_geo.is_sub_face(ap._geometry, tolerance, angle_tolerance):
                 msg = 'Aperture "{}" is not coplanar or fully bounded by its parent ' \
                     'Face "{}".'.format(ap.full_id, self.full_id)
                 msg = self._validation_message_child(
@@ -1879,10 +1898,13 @@ class Face(_BaseWithShade):
             A string with the message or a list with dictionaries if detailed is True.
         """
         detailed = False if raise_exception else detailed
+        if not self._doors:
+            return [] if detailed else ''
         angle_tolerance = math.radians(angle_tolerance)
+        parent_geo = self._geometry
         msgs = []
         for dr in self._doors:
-            if not self.geometry.is_sub_face(dr.geometry, tolerance, angle_tolerance):
+            if not parent_geo.is_sub_face(dr._geometry, tolerance, angle_tolerance):
                 msg = 'Door "{}" is not coplanar or fully bounded by its parent ' \
                     'Face "{}".'.format(dr.full_id, self.full_id)
                 msg = self._validation_message_child(
@@ -1909,9 +1931,11 @@ class Face(_BaseWithShade):
         Returns:
             A string with the message or a list with dictionaries if detailed is True.
         """
+        if len(self._apertures) + len(self._doors) <= 1:
+            return [] if detailed else ''  # a single sub-face cannot overlap
         sub_faces = self.sub_faces
-        if len(sub_faces) == 0:
-            return [] if detailed else ''
+        if not self._sub_face_bounds_overlap(sub_faces, tolerance):
+            return [] if detailed else ''  # no bounding boxes touch one another
         sf_groups = self._group_sub_faces_by_overlap(sub_faces, tolerance)
         if not all(len(g) == 1 for g in sf_groups):
             base_msg = 'Face "{}" contains Apertures and/or ' \
@@ -2042,12 +2066,9 @@ class Face(_BaseWithShade):
     def display_dict(self):
         """Get a list of DisplayFace3D dictionaries for visualizing the object."""
         base = [self._display_face(self.punched_geometry, self.type_color)]
-        for ap in self._apertures:
-            base.extend(ap.display_dict())
-        for dr in self._doors:
-            base.extend(dr.display_dict())
-        for shd in self.shades:
-            base.extend(shd.display_dict())
+        children = chain(self._apertures, self._doors,
+                         self._outdoor_shades, self._indoor_shades)
+        base.extend(chain.from_iterable(obj.display_dict() for obj in children))
         return base
 
     @property
@@ -2081,24 +2102,26 @@ class Face(_BaseWithShade):
                 X/Y axes of the plane but is not required and can be removed to
                 keep the dictionary smaller. (Default: True).
         """
-        base = {'type': 'Face'}
-        base['identifier'] = self.identifier
-        base['display_name'] = self.display_name
-        base['properties'] = self.properties.to_dict(abridged, included_prop)
-        enforce_upper_left = True if 'energy' in base['properties'] else False
-        base['geometry'] = self._geometry.to_dict(include_plane, enforce_upper_left)
-
-        base['face_type'] = self.type.name
-        if isinstance(self.boundary_condition, Outdoors) and \
-                'energy' in base['properties']:
-            base['boundary_condition'] = self.boundary_condition.to_dict(full=True)
+        props = self.properties.to_dict(abridged, included_prop)
+        is_energy = 'energy' in props
+        base = {
+            'type': 'Face',
+            'identifier': self.identifier,
+            'display_name': self.display_name,
+            'properties': props,
+            'geometry': self._geometry.to_dict(include_plane, is_energy),
+            'face_type': self._type.name
+        }
+        bc = self._boundary_condition
+        if is_energy and isinstance(bc, Outdoors):
+            base['boundary_condition'] = bc.to_dict(full=True)
         else:
-            base['boundary_condition'] = self.boundary_condition.to_dict()
+            base['boundary_condition'] = bc.to_dict()
 
-        if self._apertures != []:
+        if self._apertures:
             base['apertures'] = [ap.to_dict(abridged, included_prop, include_plane)
                                  for ap in self._apertures]
-        if self._doors != []:
+        if self._doors:
             base['doors'] = [dr.to_dict(abridged, included_prop, include_plane)
                              for dr in self._doors]
         self._add_shades_to_dict(base, abridged, included_prop, include_plane)
@@ -2106,15 +2129,69 @@ class Face(_BaseWithShade):
             base['user_data'] = self.user_data
         return base
 
+    def _bounding_objects(self):
+        """Get an iterator over all objects that define the bounding box of the Face."""
+        return chain(self._outdoor_shades, self._indoor_shades,
+                     self._apertures, self._doors, (self._geometry,))
+
+    @staticmethod
+    def _duplicate_sub_faces(sub_faces, new_parent):
+        """Get a list of duplicated sub_faces that are assigned to a new_parent."""
+        new_sub_faces = []
+        for sub_f in sub_faces:
+            new_sub_f = sub_f.duplicate()
+            new_sub_f._parent = new_parent
+            new_sub_faces.append(new_sub_f)
+        return new_sub_faces
+
     def _acceptable_sub_face_check(self, sub_face_type=Aperture):
         """Check whether the Face can accept sub-faces and raise an exception if not."""
-        assert isinstance(self.boundary_condition, Outdoors), \
+        assert isinstance(self._boundary_condition, Outdoors), \
             '{} cannot be added to Face "{}" with a {} boundary condition.'.format(
-                sub_face_type.__name__, self.full_id, self.boundary_condition)
-        assert not isinstance(self.type, AirBoundary), \
+                sub_face_type.__name__, self.full_id, self._boundary_condition)
+        assert type(self._type) is not AirBoundary, \
             '{} cannot be added to AirBoundary Face "{}".'.format(
                 sub_face_type.__name__, self.full_id)
 
+    def _parent_sub_faces(self, sub_faces, sub_face_list):
+        """Parent validated Apertures or Doors to this Face and add them to a list.
+
+        Args:
+            sub_faces: A tuple of Apertures or Doors that have already been checked.
+            sub_face_list: The list of this Face to which the sub_faces are
+                added (either self._apertures or self._doors).
+        """
+        normal = self._geometry.normal
+        for sub_face in sub_faces:
+            sub_face._parent = self
+            if normal.dot(sub_face.normal) < 0:  # reversed normal
+                sub_face._geometry = sub_face._geometry.flip()
+            sub_face_list.append(sub_face)
+        self._punched_geometry = None  # reset so that it can be re-computed
+
+    @staticmethod
+    def _remove_degenerate(sub_faces, tolerance):
+        """Get a list of Apertures or Doors with degenerate objects removed.
+
+        Args:
+            sub_faces: A list of Apertures or Doors from which colinear vertices
+                will be removed.
+            tolerance: The minimum distance between a vertex and the boundary segments
+                at which point the vertex is considered colinear.
+
+        Returns:
+            A list of the input sub_faces that are not degenerate. Any sub-faces
+            that were found to be degenerate will be detached from their parent.
+        """
+        clean_sub_faces = []
+        for sub_f in sub_faces:
+            try:
+                sub_f.remove_colinear_vertices(tolerance)
+                clean_sub_faces.append(sub_f)
+            except ValueError:  # degenerate sub-face to be removed
+                sub_f._parent = None
+        return clean_sub_faces
+
     @staticmethod
     def _remove_overlapping_sub_faces(sub_faces, tolerance):
         """Get a list of Apertures and/or Doors with no overlaps.
@@ -2139,6 +2216,40 @@ class Face(_BaseWithShade):
                 clean_sub_faces.append(sf_group[0])
         return clean_sub_faces
 
+    @staticmethod
+    def _sub_face_bounds_overlap(sub_faces, tolerance):
+        """Check whether the 2D bounding rectangles of any Apertures and/or Doors overlap.
+
+        This is a fast pre-check for _group_sub_faces_by_overlap since sub-faces
+        with bounding rectangles that do not overlap cannot overlap with one another.
+        The rectangles are computed in the same plane that _group_sub_faces_by_overlap
+        uses to compare the sub-face polygons (that of the largest sub-face).
+
+        Args:
+            sub_faces: A list of Apertures or Doors to be checked for overlapping.
+            tolerance: The minimum distance between bounding rectangles at which
+                they are considered to overlap.
+
+        Returns:
+            True if any two bounding rectangles overlap. False if none of them overlap.
+        """
+        # get the bounding rectangles of the sub-faces in the plane of the largest one
+        r_plane = max(sub_faces, key=lambda x: x.area).geometry.plane
+        bounds = []
+        for sf in sub_faces:
+            pts_2d = [r_plane.xyz_to_xy(pt) for pt in sf.vertices]
+            xs, ys = [pt.x for pt in pts_2d], [pt.y for pt in pts_2d]
+            bounds.append((min(xs), max(xs), min(ys), max(ys)))
+        # sort the bounding rectangles by their minimum X so they can be swept
+        bounds.sort(key=lambda b: b[0])
+        for i, (min_x1, max_x1, min_y1, max_y1) in enumerate(bounds):
+            for min_x2, _, min_y2, max_y2 in bounds[i + 1:]:
+                if min_x2 > max_x1 + tolerance:
+                    break  # no following bounding rectangle can overlap this one
+                if min_y2 <= max_y1 + tolerance and min_y1 <= max_y2 + tolerance:
+                    return True
+        return False
+
     @staticmethod
     def _group_sub_faces_by_overlap(sub_faces, tolerance):
         """Group a Apertures and/or Doors depending on whether they overlap one another.
@@ -2200,14 +2311,11 @@ class Face(_BaseWithShade):
         new_f = Face(self.identifier, self.geometry, self.type, self.boundary_condition)
         new_f._display_name = self._display_name
         new_f._user_data = None if self.user_data is None else self.user_data.copy()
-        new_f._apertures = [ap.duplicate() for ap in self._apertures]
-        new_f._doors = [dr.duplicate() for dr in self._doors]
-        for ap in new_f._apertures:
-            ap._parent = new_f
-        for dr in new_f._doors:
-            dr._parent = new_f
+        new_f._apertures = self._duplicate_sub_faces(self._apertures, new_f)
+        new_f._doors = self._duplicate_sub_faces(self._doors, new_f)
         self._duplicate_child_shades(new_f)
         new_f._punched_geometry = self._punched_geometry
+        new_f._upper_left_verts = self._upper_left_verts
         new_f._properties._duplicate_extension_attr(self._properties)
         return new_f
 
@@ -1,27 +1,32 @@
 """Face Types."""
-from ladybug_geometry.geometry3d.pointvector import Vector3D
 import re
 import math
 
+_CLEAN_NAME_PATTERN = re.compile(r'[\s_]')  # pattern to clean face type names
+
 
 class _FaceType(object):
     __slots__ = ()
+    _name = None  # set on each face type class to avoid looking up the class name
 
     def __init__(self):
         pass
 
     @property
     def name(self):
-        return self.__class__.__name__
+        return self._name or self.__class__.__name__
 
     def ToString(self):
         return self.__repr__()
 
     def __eq__(self, other):
-        return self.__class__ == other.__class__
+        return type(self) is type(other)
 
     def __ne__(self, other):
-        return not self.__eq__(other)
+        return type(self) is not type(other)
+
+    def __hash__(self):
+        return hash(type(self))
 
     def __repr__(self):
         return self.name
@@ -30,36 +35,42 @@ class _FaceType(object):
 class Wall(_FaceType):
     """Type for walls."""
     __slots__ = ()
-    pass
+    _name = 'Wall'
 
 
 class RoofCeiling(_FaceType):
     """Type for roofs and ceilings."""
     __slots__ = ()
-    pass
+    _name = 'RoofCeiling'
 
 
 class Floor(_FaceType):
     """Type for floors."""
     __slots__ = ()
-    pass
+    _name = 'Floor'
 
 
 class AirBoundary(_FaceType):
     """Type for air boundaries (aka. virtual partitions) between Rooms."""
     __slots__ = ()
-    pass
+    _name = 'AirBoundary'
 
 
 class _FaceTypes(object):
     """Face types."""
+    __slots__ = ('_wall', '_roof_ceiling', '_floor', '_air_boundary', '_type_name_dict')
 
     def __init__(self):
         self._wall = Wall()
         self._roof_ceiling = RoofCeiling()
         self._floor = Floor()
         self._air_boundary = AirBoundary()
-        self._type_name_dict = None
+        self._type_name_dict = {
+            'wall': self._wall,
+            'roofceiling': self._roof_ceiling,
+            'floor': self._floor,
+            'airboundary': self._air_boundary
+        }
 
     @property
     def wall(self):
@@ -86,26 +97,13 @@ class _FaceTypes(object):
         Args:
             face_type_name: A text string for the face type (eg. "Wall").
         """
-        if self._type_name_dict is None:
-            self._build_type_name_dict()
-        try:
-            return self._type_name_dict[re.sub(r'[\s_]', '', face_type_name.lower())]
-        except KeyError:
+        clean_name = _CLEAN_NAME_PATTERN.sub('', face_type_name.lower())
+        face_type = self._type_name_dict.get(clean_name)
+        if face_type is None:
             raise ValueError(
                 '"{}" is not a valid face type name.\nChoose from the following'
                 ': {}'.format(face_type_name, list(self._type_name_dict.keys())))
-
-    def _build_type_name_dict(self):
-        """Build a dictionary that can be used to lookup face types by name."""
-        attr = [atr for atr in dir(self) if not atr.startswith('_')]
-        clean_attr = [re.sub(r'[\s_]', '', atr.lower()) for atr in attr]
-        self._type_name_dict = {}
-        for atr_name, atr in zip(clean_attr, attr):
-            try:
-                full_attr = getattr(self, '_' + atr)
-                self._type_name_dict[atr_name] = full_attr
-            except AttributeError:
-                pass  # callable method that has no static default object
+        return face_type
 
     def __contains__(self, value):
         return isinstance(value, _FaceType)
@@ -116,6 +114,30 @@ class _FaceTypes(object):
 
 
 face_types = _FaceTypes()
+_DEFAULT_ROOF_COS = math.cos(math.radians(60))  # cosine of default roof_angle
+_DEFAULT_FLOOR_COS = math.cos(math.radians(130))  # cosine of default floor_angle
+
+
+def _angle_cosines(roof_angle, floor_angle):
+    """Get the cosines of roof and floor angles in degrees, reusing the defaults."""
+    roof_cos = _DEFAULT_ROOF_COS if roof_angle == 60 \
+        else math.cos(math.radians(roof_angle))
+    floor_cos = _DEFAULT_FLOOR_COS if floor_angle == 130 \
+        else math.cos(math.radians(floor_angle))
+    return roof_cos, floor_cos
+
+
+def _type_from_cosines(normal_vector, roof_cos, floor_cos):
+    """Get the face type of a normal vector using precomputed threshold cosines."""
+    # compare the cosine of the angle to the Z axis, which decreases as the angle grows
+    x, y, z = normal_vector.x, normal_vector.y, normal_vector.z
+    cos_angle = z / math.sqrt(x * x + y * y + z * z)
+    if cos_angle > roof_cos:
+        return face_types.roof_ceiling
+    elif cos_angle > floor_cos:
+        return face_types.wall
+    else:
+        return face_types.floor
 
 
 def get_type_from_normal(normal_vector, roof_angle=60, floor_angle=130):
@@ -141,13 +163,29 @@ def get_type_from_normal(normal_vector, roof_angle=60, floor_angle=130):
     Returns:
         Face type instance.
     """
-    z_axis = Vector3D(0, 0, 1)
-    angle = math.degrees(z_axis.angle(normal_vector))
-    if angle < roof_angle:
-        return face_types.roof_ceiling
-    elif roof_angle <= angle < floor_angle:
-        return face_types.wall
-    else:
-        return face_types.floor
+    roof_cos, floor_cos = _angle_cosines(roof_angle, floor_angle)
+    return _type_from_cosines(normal_vector, roof_cos, floor_cos)
+
+
+def get_types_from_normals(normal_vectors, roof_angle=60, floor_angle=130):
+    """Return a list of face types for several normal vectors at once.
 
-    return face_types.wall
+    This gives the same result as calling get_type_from_normal for each of the
+    normal_vectors but the angle thresholds are only computed once, making it
+    better suited to classifying many faces together.
+
+    Args:
+        normal_vectors: A list of normal vectors as ladybug_geometry Vector3D.
+        roof_angle: A number between 0 and 90 to set the angle from the horizontal
+            plane below which faces will be considered roofs instead of
+            walls. (Default: 60, recommended by the ASHRAE 90.1 standard).
+        floor_angle: A number between 90 and 180 to set the angle from the horizontal
+            plane above which faces will be considered floors instead of
+            walls. (Default: 130, recommended by the ASHRAE 90.1 standard).
+
+    Returns:
+        A list of face type instances that align with the input normal_vectors.
+    """
+    roof_cos, floor_cos = _angle_cosines(roof_angle, floor_angle)
+    return [_type_from_cosines(normal_vector, roof_cos, floor_cos)
+            for normal_vector in normal_vectors]
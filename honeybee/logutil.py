@@ -49,6 +49,9 @@ def get_logger(name, filename='honeybee.log', file_log_level='DEBUG',
                console_log_level='WARNING'):
     """Get a logger to be used for each module.
 
+    Calling this function again for a logger that already has handlers will
+    return the existing logger without adding duplicate handlers.
+
     Args:
         name: Logger name. The good practice is to set it to __init__ from inside each
             modules.
@@ -58,11 +61,13 @@ def get_logger(name, filename='honeybee.log', file_log_level='DEBUG',
         console_log_level: Log level for stream handler as a string (Default: WARNING).
     """
     logger = logging.getLogger(name)
+    if logger.handlers:  # logger has already been set up; avoid duplicate handlers
+        return logger
 
     # create a file handler to log debug and higher level logs
     if filename:
         log_file = os.path.join(_get_log_folder(), filename)
-        file_handler = TimedRotatingFileHandler(log_file, when='midnight')
+        file_handler = TimedRotatingFileHandler(log_file, when='midnight', delay=True)
         file_format = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         file_handler.setFormatter(file_format)
         file_handler.setLevel(_get_log_level(file_log_level))
@@ -4,10 +4,11 @@ from __future__ import division
 import os
 import sys
 import io
-import re
 import json
 import math
 import uuid
+from itertools import chain
+from operator import methodcaller
 try:  # check if we are in IronPython
     import cPickle as pickle
 except ImportError:  # wea are in cPython
@@ -174,61 +175,53 @@ class Model(_Base):
         angle_tol = 1.0 if 'angle_tolerance' not in data or \
             data['angle_tolerance'] is None else data['angle_tolerance']
 
-        # import all of the geometry
-        rooms = None  # import rooms
+        # build the model object and import all of the geometry directly into it
+        # objects are freshly parsed without parents so they skip the add_* checks
+        model = Model(data['identifier'], units=units, tolerance=tol,
+                      angle_tolerance=angle_tol)
         if 'rooms' in data and data['rooms'] is not None:
-            rooms = []
+            rooms = model._rooms
             for r in data['rooms']:
                 try:
                     rooms.append(Room.from_dict(r, tol, angle_tol))
                 except Exception as e:
                     invalid_dict_error(r, e)
-        orphaned_faces = None  # import orphaned faces
         if 'orphaned_faces' in data and data['orphaned_faces'] is not None:
-            orphaned_faces = []
+            orphaned_faces = model._orphaned_faces
             for f in data['orphaned_faces']:
                 try:
                     orphaned_faces.append(Face.from_dict(f))
                 except Exception as e:
                     invalid_dict_error(f, e)
-        orphaned_apertures = None  # import orphaned apertures
         if 'orphaned_apertures' in data and data['orphaned_apertures'] is not None:
-            orphaned_apertures = []
+            orphaned_apertures = model._orphaned_apertures
             for a in data['orphaned_apertures']:
                 try:
                     orphaned_apertures.append(Aperture.from_dict(a))
                 except Exception as e:
                     invalid_dict_error(a, e)
-        orphaned_doors = None  # import orphaned doors
         if 'orphaned_doors' in data and data['orphaned_doors'] is not None:
-            orphaned_doors = []
+            orphaned_doors = model._orphaned_doors
             for d in data['orphaned_doors']:
                 try:
                     orphaned_doors.append(Door.from_dict(d))
                 except Exception as e:
                     invalid_dict_error(d, e)
-        orphaned_shades = None  # import orphaned shades
         if 'orphaned_shades' in data and data['orphaned_shades'] is not None:
-            orphaned_shades = []
+            orphaned_shades = model._orphaned_shades
             for s in data['orphaned_shades']:
                 try:
                     orphaned_shades.append(Shade.from_dict(s))
                 except Exception as e:
                     invalid_dict_error(s, e)
-        shade_meshes = None  # import shade meshes
         if 'shade_meshes' in data and data['shade_meshes'] is not None:
-            shade_meshes = []
+            shade_meshes = model._shade_meshes
             for sm in data['shade_meshes']:
                 try:
                     shade_meshes.append(ShadeMesh.from_dict(sm))
                 except Exception as e:
                     invalid_dict_error(sm, e)
 
-        # build the model object
-        model = Model(
-            data['identifier'], rooms, orphaned_faces, orphaned_shades,
-            orphaned_apertures, orphaned_doors, shade_meshes,
-            units, tol, angle_tol)
         if 'display_name' in data and data['display_name'] is not None:
             model.display_name = data['display_name']
         if 'user_data' in data and data['user_data'] is not None:
@@ -472,22 +465,21 @@ class Model(_Base):
         shade_meshes = []
         apertures = []
         doors = []
+        obj_lists = {
+            Room: rooms, Face: faces, Shade: shades, ShadeMesh: shade_meshes,
+            Aperture: apertures, Door: doors
+        }
         for obj in objects:
-            if isinstance(obj, Room):
-                rooms.append(obj)
-            elif isinstance(obj, Face):
-                faces.append(obj)
-            elif isinstance(obj, Shade):
-                shades.append(obj)
-            elif isinstance(obj, ShadeMesh):
-                shade_meshes.append(obj)
-            elif isinstance(obj, Aperture):
-                apertures.append(obj)
-            elif isinstance(obj, Door):
-                doors.append(obj)
-            else:
-                raise TypeError('Expected Room, Face, Shade, Aperture or Door '
-                                'for Model. Got {}'.format(type(obj)))
+            try:
+                obj_lists[type(obj)].append(obj)
+            except KeyError:  # possibly a subclass of one of the honeybee objects
+                for obj_type, obj_list in obj_lists.items():
+                    if isinstance(obj, obj_type):
+                        obj_list.append(obj)
+                        break
+                else:
+                    raise TypeError('Expected Room, Face, Shade, Aperture or Door '
+                                    'for Model. Got {}'.format(type(obj)))
 
         return cls(identifier, rooms, faces, shades, apertures, doors, shade_meshes,
                    units, tolerance, angle_tolerance)
@@ -697,7 +689,7 @@ class Model(_Base):
     @property
     def faces(self):
         """Get a list of all Face objects in the model."""
-        child_faces = [face for room in self._rooms for face in room._faces]
+        child_faces = list(chain.from_iterable(room._faces for room in self._rooms))
         return child_faces + self._orphaned_faces
 
     @property
@@ -726,48 +718,59 @@ class Model(_Base):
     def shades(self):
         """Get a list of all Shade objects in the model."""
         child_shades = []
+        extend = child_shades.extend
         for room in self._rooms:
-            child_shades.extend(room.shades)
-            for face in room.faces:
-                child_shades.extend(face.shades)
+            extend(room._outdoor_shades)
+            extend(room._indoor_shades)
+            for face in room._faces:
+                extend(face._outdoor_shades)
+                extend(face._indoor_shades)
                 for ap in face._apertures:
-                    child_shades.extend(ap.shades)
+                    extend(ap._outdoor_shades)
+                    extend(ap._indoor_shades)
                 for dr in face._doors:
-                    child_shades.extend(dr.shades)
+                    extend(dr._outdoor_shades)
+                    extend(dr._indoor_shades)
         for face in self._orphaned_faces:
-            child_shades.extend(face.shades)
+            extend(face._outdoor_shades)
+            extend(face._indoor_shades)
             for ap in face._apertures:
-                child_shades.extend(ap.shades)
+                extend(ap._outdoor_shades)
+                extend(ap._indoor_shades)
             for dr in face._doors:
-                child_shades.extend(dr.shades)
+                extend(dr._outdoor_shades)
+                extend(dr._indoor_shades)
         for ap in self._orphaned_apertures:
-            child_shades.extend(ap.shades)
+            extend(ap._outdoor_shades)
+            extend(ap._indoor_shades)
         for dr in self._orphaned_doors:
-            child_shades.extend(dr.shades)
+            extend(dr._outdoor_shades)
+            extend(dr._indoor_shades)
         return child_shades + self._orphaned_shades
 
     @property
     def indoor_shades(self):
         """Get a list of all indoor Shade objects in the model."""
         child_shades = []
+        extend = child_shades.extend
         for room in self._rooms:
-            child_shades.extend(room._indoor_shades)
-            for face in room.faces:
-                child_shades.extend(face._indoor_shades)
+            extend(room._indoor_shades)
+            for face in room._faces:
+                extend(face._indoor_shades)
                 for ap in face._apertures:
-                    child_shades.extend(ap._indoor_shades)
+                    extend(ap._indoor_shades)
                 for dr in face._doors:
-                    child_shades.extend(dr._indoor_shades)
+                    extend(dr._indoor_shades)
         for face in self._orphaned_faces:
-            child_shades.extend(face._indoor_shades)
+            extend(face._indoor_shades)
             for ap in face._apertures:
-                child_shades.extend(ap._indoor_shades)
+                extend(ap._indoor_shades)
             for dr in face._doors:
-                child_shades.extend(dr._indoor_shades)
+                extend(dr._indoor_shades)
         for ap in self._orphaned_apertures:
-            child_shades.extend(ap._indoor_shades)
+            extend(ap._indoor_shades)
         for dr in self._orphaned_doors:
-            child_shades.extend(dr._indoor_shades)
+            extend(dr._indoor_shades)
         return child_shades
 
     @property
@@ -777,24 +780,25 @@ class Model(_Base):
         This includes all of the orphaned_shades.
         """
         child_shades = []
+        extend = child_shades.extend
         for room in self._rooms:
-            child_shades.extend(room._outdoor_shades)
-            for face in room.faces:
-                child_shades.extend(face._outdoor_shades)
+            extend(room._outdoor_shades)
+            for face in room._faces:
+                extend(face._outdoor_shades)
                 for ap in face._apertures:
-                    child_shades.extend(ap._outdoor_shades)
+                    extend(ap._outdoor_shades)
                 for dr in face._doors:
-                    child_shades.extend(dr._outdoor_shades)
+                    extend(dr._outdoor_shades)
         for face in self._orphaned_faces:
-            child_shades.extend(face._outdoor_shades)
+            extend(face._outdoor_shades)
             for ap in face._apertures:
-                child_shades.extend(ap._outdoor_shades)
+                extend(ap._outdoor_shades)
             for dr in face._doors:
-                child_shades.extend(dr._outdoor_shades)
+                extend(dr._outdoor_shades)
         for ap in self._orphaned_apertures:
-            child_shades.extend(ap._outdoor_shades)
+            extend(ap._outdoor_shades)
         for dr in self._orphaned_doors:
-            child_shades.extend(dr._outdoor_shades)
+            extend(dr._outdoor_shades)
         return child_shades + self._orphaned_shades
 
     @property
@@ -973,7 +977,7 @@ class Model(_Base):
         This is useful for grouping rooms by their Zone for export.
         """
         zones = {}
-        for room in self.rooms:
+        for room in self._rooms:
             try:
                 zones[room.zone].append(room)
             except KeyError:  # first room to be found in the zone
@@ -986,18 +990,13 @@ class Model(_Base):
             'Expected Model. Got {}.'.format(type(other_model))
         if self.units != other_model.units:
             other_model.convert_to_units(self.units)
-        for room in other_model._rooms:
-            self._rooms.append(room)
-        for face in other_model._orphaned_faces:
-            self._orphaned_faces.append(face)
-        for shade in other_model._orphaned_shades:
-            self._orphaned_shades.append(shade)
-        for shade_mesh in other_model._shade_meshes:
-            self._shade_meshes.append(shade_mesh)
-        for aperture in other_model._orphaned_apertures:
-            self._orphaned_apertures.append(aperture)
-        for door in other_model._orphaned_doors:
-            self._orphaned_doors.append(door)
+        # objects in the other model were already validated when they were added to it
+        self._rooms.extend(other_model._rooms)
+        self._orphaned_faces.extend(other_model._orphaned_faces)
+        self._orphaned_shades.extend(other_model._orphaned_shades)
+        self._shade_meshes.extend(other_model._shade_meshes)
+        self._orphaned_apertures.extend(other_model._orphaned_apertures)
+        self._orphaned_doors.extend(other_model._orphaned_doors)
 
     def add_room(self, obj):
         """Add a Room object to the model."""
@@ -1044,7 +1043,7 @@ class Model(_Base):
             room_ids: An optional list of Room identifiers to only remove certain rooms
                 from the model. If None, all Rooms will be removed. (Default: None).
         """
-        self._rooms = self._remove_by_ids(self.rooms, room_ids)
+        self._rooms = self._remove_by_ids(self._rooms, room_ids)
 
     def remove_faces(self, face_ids=None):
         """Remove orphaned Faces from the model.
@@ -1198,15 +1197,7 @@ class Model(_Base):
 
     def rooms_by_identifier(self, identifiers):
         """Get a list of Room objects in the model given the Room identifiers."""
-        rooms, missing_ids = [], []
-        model_rooms = self._rooms
-        for obj_id in identifiers:
-            for room in model_rooms:
-                if room.identifier == obj_id:
-                    rooms.append(room)
-                    break
-            else:
-                missing_ids.append(obj_id)
+        rooms, missing_ids = self._objects_by_identifier(self._rooms, identifiers)
         if len(missing_ids) != 0:
             all_objs = ' '.join(['"' + rid + '"' for rid in missing_ids])
             raise ValueError(
@@ -1216,15 +1207,7 @@ class Model(_Base):
 
     def faces_by_identifier(self, identifiers):
         """Get a list of Face objects in the model given the Face identifiers."""
-        faces, missing_ids = [], []
-        model_faces = self.faces
-        for obj_id in identifiers:
-            for face in model_faces:
-                if face.identifier == obj_id:
-                    faces.append(face)
-                    break
-            else:
-                missing_ids.append(obj_id)
+        faces, missing_ids = self._objects_by_identifier(self.faces, identifiers)
         if len(missing_ids) != 0:
             all_objs = ' '.join(['"' + rid + '"' for rid in missing_ids])
             raise ValueError(
@@ -1234,15 +1217,7 @@ class Model(_Base):
 
     def apertures_by_identifier(self, identifiers):
         """Get a list of Aperture objects in the model given the Aperture identifiers."""
-        apertures, missing_ids = [], []
-        model_apertures = self.apertures
-        for obj_id in identifiers:
-            for aperture in model_apertures:
-                if aperture.identifier == obj_id:
-                    apertures.append(aperture)
-                    break
-            else:
-                missing_ids.append(obj_id)
+        apertures, missing_ids = self._objects_by_identifier(self.apertures, identifiers)
         if len(missing_ids) != 0:
             all_objs = ' '.join(['"' + rid + '"' for rid in missing_ids])
             raise ValueError(
@@ -1253,15 +1228,7 @@ class Model(_Base):
 
     def doors_by_identifier(self, identifiers):
         """Get a list of Door objects in the model given the Door identifiers."""
-        doors, missing_ids = [], []
-        model_doors = self.doors
-        for obj_id in identifiers:
-            for door in model_doors:
-                if door.identifier == obj_id:
-                    doors.append(door)
-                    break
-            else:
-                missing_ids.append(obj_id)
+        doors, missing_ids = self._objects_by_identifier(self.doors, identifiers)
         if len(missing_ids) != 0:
             all_objs = ' '.join(['"' + rid + '"' for rid in missing_ids])
             raise ValueError(
@@ -1271,15 +1238,7 @@ class Model(_Base):
 
     def shades_by_identifier(self, identifiers):
         """Get a list of Shade objects in the model given the Shade identifiers."""
-        shades, missing_ids = [], []
-        model_shades = self.shades
-        for obj_id in identifiers:
-            for face in model_shades:
-                if face.identifier == obj_id:
-                    shades.append(face)
-                    break
-            else:
-                missing_ids.append(obj_id)
+        shades, missing_ids = self._objects_by_identifier(self.shades, identifiers)
         if len(missing_ids) != 0:
             all_objs = ' '.join(['"' + rid + '"' for rid in missing_ids])
             raise ValueError(
@@ -1290,15 +1249,7 @@ class Model(_Base):
     def shade_meshes_by_identifier(self, identifiers):
         """Get a list of ShadeMesh objects in the model given the ShadeMesh identifiers.
         """
-        shades, missing_ids = [], []
-        model_shades = self._shade_meshes
-        for obj_id in identifiers:
-            for sm in model_shades:
-                if sm.identifier == obj_id:
-                    shades.append(sm)
-                    break
-            else:
-                missing_ids.append(obj_id)
+        shades, missing_ids = self._objects_by_identifier(self._shade_meshes, identifiers)
         if len(missing_ids) != 0:
             a_os = ' '.join(['"' + rid + '"' for rid in missing_ids])
             raise ValueError(
@@ -1381,12 +1332,12 @@ class Model(_Base):
         for shade in self.shades:
             shade.identifier = clean_and_number_string(
                 shade.display_name, shd_dict, 'Shade identifier')
-        for shade_mesh in self.shade_meshes:
+        for shade_mesh in self._shade_meshes:
             shade_mesh.identifier = clean_and_number_string(
                 shade_mesh.display_name, sm_dict, 'ShadeMesh identifier')
         # reset all of the Surface boundary conditions if requested
         if repair_surface_bcs:
-            for room in self.rooms:
+            for room in self._rooms:
                 for face in room.faces:
                     if isinstance(face.boundary_condition, Surface):
                         old_objs = face.boundary_condition.boundary_condition_objects
@@ -1439,7 +1390,7 @@ class Model(_Base):
             objects and update things like Surface boundary conditions.
         """
         room_dict, room_map = {}, {}
-        for room in self.rooms:
+        for room in self._rooms:
             new_id = clean_and_number_string(
                 room.display_name, room_dict, 'Room identifier')
             room_map[room.identifier] = new_id
@@ -1481,7 +1432,7 @@ class Model(_Base):
 
         # merge coplanar faces if requested
         if merge_coplanar:
-            for room in self.rooms:
+            for room in self._rooms:
                 room.merge_coplanar_faces(tol, ang_tol)
 
         # intersect adjacencies if requested
@@ -1994,7 +1945,7 @@ class Model(_Base):
         """
         tolerance = self.tolerance if tolerance is None else tolerance
         adj_dict = {}  # dictionary to track adjacent geometries
-        for room in self.rooms:
+        for room in self._rooms:
             try:
                 r_adj = room.clean_envelope(adj_dict, tolerance=tolerance)
                 adj_dict.update(r_adj)
@@ -2166,7 +2117,7 @@ class Model(_Base):
         if detailed:
             return [m for msg in full_msgs for m in msg]
         full_msg = '\n'.join(full_msgs)
-        if raise_exception and len(full_msgs) != 0:
+        if raise_exception and full_msgs:
             raise ValueError(full_msg)
         return full_msg
 
@@ -2232,7 +2183,7 @@ class Model(_Base):
         if detailed:
             return [m for msg in full_msgs for m in msg]
         full_msg = '\n'.join(full_msgs)
-        if raise_exception and len(full_msgs) != 0:
+        if raise_exception and full_msgs:
             raise ValueError(full_msg)
         return full_msg
 
@@ -2266,7 +2217,7 @@ class Model(_Base):
         if detailed:
             return [m for msg in full_msgs for m in msg]
         full_msg = '\n'.join(full_msgs)
-        if raise_exception and len(full_msgs) != 0:
+        if raise_exception and full_msgs:
             raise ValueError(full_msg)
         return full_msg
 
@@ -2374,20 +2325,13 @@ class Model(_Base):
         """
         tolerance = self.tolerance if tolerance is None else tolerance
         detailed = False if raise_exception else detailed
-        msgs = []
-        for face in self.faces:
-            msgs.append(face.check_planar(tolerance, False, detailed))
-        for shd in self.shades:
-            msgs.append(shd.check_planar(tolerance, False, detailed))
-        for ap in self.apertures:
-            msgs.append(ap.check_planar(tolerance, False, detailed))
-        for dr in self.doors:
-            msgs.append(dr.check_planar(tolerance, False, detailed))
+        all_objs = chain(self.faces, self.shades, self.apertures, self.doors)
+        msgs = (obj.check_planar(tolerance, False, detailed) for obj in all_objs)
         full_msgs = [msg for msg in msgs if msg]
         if detailed:
             return [m for msg in full_msgs for m in msg]
         full_msg = '\n'.join(full_msgs)
-        if raise_exception and len(full_msgs) != 0:
+        if raise_exception and full_msgs:
             raise ValueError(full_msg)
         return full_msg
 
@@ -2411,22 +2355,15 @@ class Model(_Base):
         """
         tolerance = self.tolerance if tolerance is None else tolerance
         detailed = False if raise_exception else detailed
-        msgs = []
-        for room in self.rooms:
-            msgs.append(room.check_self_intersecting(tolerance, False, detailed))
-        for face in self.orphaned_faces:
-            msgs.append(face.check_self_intersecting(tolerance, False, detailed))
-        for shd in self.orphaned_shades:
-            msgs.append(shd.check_self_intersecting(tolerance, False, detailed))
-        for ap in self.orphaned_apertures:
-            msgs.append(ap.check_self_intersecting(tolerance, False, detailed))
-        for dr in self.orphaned_doors:
-            msgs.append(dr.check_self_intersecting(tolerance, False, detailed))
+        all_objs = chain(self._rooms, self._orphaned_faces, self._orphaned_shades,
+                         self._orphaned_apertures, self._orphaned_doors)
+        msgs = (obj.check_self_intersecting(tolerance, False, detailed)
+                for obj in all_objs)
         full_msgs = [msg for msg in msgs if msg]
         if detailed:
             return [m for msg in full_msgs for m in msg]
         full_msg = '\n'.join(full_msgs)
-        if raise_exception and len(full_msgs) != 0:
+        if raise_exception and full_msgs:
             raise ValueError(full_msg)
         return full_msg
 
@@ -2642,7 +2579,7 @@ class Model(_Base):
         tolerance = self.tolerance if tolerance is None else tolerance
         detailed = False if raise_exception else detailed
         # group the rooms by their floor heights to enable collision checking
-        if len(self.rooms) == 0:
+        if not self._rooms:
             return [] if detailed else ''
         room_groups, _ = Room.group_by_floor_height(self.rooms, tolerance)
         # loop trough the groups and detect collisions
@@ -2697,13 +2634,15 @@ class Model(_Base):
                         sr.append(self._self_adj_check(
                             'Door', dr, door_bc_ids, room_ids, dr_set, detailed))
         # check to see if the adjacent objects are in the model
-        mr = self._missing_adj_check(self.rooms_by_identifier, room_ids)
-        mf = self._missing_adj_check(self.faces_by_identifier, face_bc_ids)
-        ma = self._missing_adj_check(self.apertures_by_identifier, ap_bc_ids)
-        md = self._missing_adj_check(self.doors_by_identifier, door_bc_ids)
+        if not room_ids:  # no Surface boundary conditions in the model
+            return [] if detailed else ''
+        mr = self._missing_adj_check(self._rooms, room_ids)
+        mf = self._missing_adj_check(self.faces, face_bc_ids)
+        ma = self._missing_adj_check(self.apertures, ap_bc_ids) if ap_bc_ids else ()
+        md = self._missing_adj_check(self.doors, door_bc_ids) if door_bc_ids else ()
         # if not, go back and find the original object with the missing BC object
         msgs = []
-        if len(mr) != 0 or len(mf) != 0 or len(ma) != 0 or len(md) != 0:
+        if mr or mf or ma or md:
             for room in self._rooms:
                 for face in room._faces:
                     if isinstance(face.boundary_condition, Surface):
@@ -2900,7 +2839,7 @@ class Model(_Base):
 
         # return all of the validation error messages that were gathered
         full_msg = full_msgs if detailed else '\n'.join(full_msgs)
-        if raise_exception and len(full_msgs) != 0:
+        if raise_exception and full_msgs:
             raise ValueError(full_msg)
         return full_msg
 
@@ -2964,39 +2903,7 @@ class Model(_Base):
                 * 2 = The identifier of the parent Room of the parent Face of the
                   original Aperture (if it exists).
         """
-        triangulated_apertures = []
-        parents_to_edit = []
-        all_apertures = self.apertures
-        adj_check = []  # confirms when interior apertures are triangulated by adjacency
-        for ap in all_apertures:
-            if len(ap.geometry) <= 4:
-                pass
-            elif ap.identifier not in adj_check:
-                # generate the new triangulated apertures
-                ap_mesh3d = ap.triangulated_mesh3d
-                new_verts = [[ap_mesh3d[v] for v in face] for face in ap_mesh3d.faces]
-                new_ap_geo = [Face3D(verts, ap.geometry.plane) for verts in new_verts]
-                new_ap_geo = self._remove_sliver_geometries(new_ap_geo)
-                new_aps, parent_edit_info = self._replace_aperture(ap, new_ap_geo)
-                triangulated_apertures.append(new_aps)
-                if parent_edit_info is not None:
-                    parents_to_edit.append(parent_edit_info)
-                # coordinate new apertures with any adjacent apertures
-                if isinstance(ap.boundary_condition, Surface):
-                    bc_obj_identifier = ap.boundary_condition.boundary_condition_object
-                    for other_ap in all_apertures:
-                        if other_ap.identifier == bc_obj_identifier:
-                            adj_ap = other_ap
-                            break
-                    new_adj_ap_geo = [face.flip() for face in new_ap_geo]
-                    new_adj_aps, edit_in = self._replace_aperture(adj_ap, new_adj_ap_geo)
-                    for new_ap, new_adj_ap in zip(new_aps, new_adj_aps):
-                        new_ap.set_adjacency(new_adj_ap)
-                    triangulated_apertures.append(new_adj_aps)
-                    if edit_in is not None:
-                        parents_to_edit.append(edit_in)
-                    adj_check.append(adj_ap.identifier)
-        return triangulated_apertures, parents_to_edit
+        return self._triangulated_sub_faces(self.apertures, self._replace_aperture)
 
     def triangulated_doors(self):
         """Get triangulated versions of the model Doors that have more than 4 sides.
@@ -3025,39 +2932,56 @@ class Model(_Base):
                 * 2 = The identifier of the parent Room of the parent Face of the
                   original Door (if it exists).
         """
-        triangulated_doors = []
+        return self._triangulated_sub_faces(self.doors, self._replace_door)
+
+    def _triangulated_sub_faces(self, all_sub_faces, replace_function):
+        """Get triangulated versions of Apertures or Doors that have more than 4 sides.
+
+        Args:
+            all_sub_faces: A list of all Apertures or all Doors in the model.
+            replace_function: The method used to generate the new sub-faces from
+                the original sub-face and its triangulated geometry. This should
+                be either _replace_aperture or _replace_door.
+
+        Returns:
+            A tuple with two elements that are the triangulated sub-faces and
+            the parents_to_edit. See triangulated_apertures for more information.
+        """
+        triangulated_sub_faces = []
         parents_to_edit = []
-        all_doors = self.doors
-        adj_check = []  # confirms when interior doors are triangulated by adjacency
-        for dr in all_doors:
-            if len(dr.geometry) <= 4:
-                pass
-            elif dr.identifier not in adj_check:
-                # generate the new triangulated doors
-                dr_mesh3d = dr.triangulated_mesh3d
-                new_verts = [[dr_mesh3d[v] for v in face] for face in dr_mesh3d.faces]
-                new_dr_geo = [Face3D(verts, dr.geometry.plane) for verts in new_verts]
-                new_dr_geo = self._remove_sliver_geometries(new_dr_geo)
-                new_drs, parent_edit_info = self._replace_door(dr, new_dr_geo)
-                triangulated_doors.append(new_drs)
+        to_triangulate = [sf for sf in all_sub_faces if len(sf.geometry) > 4]
+        if not to_triangulate:
+            return triangulated_sub_faces, parents_to_edit
+        adj_check = set()  # confirms interior sub-faces triangulated by adjacency
+        sf_dict = {sf.identifier: sf for sf in reversed(all_sub_faces)}
+        for sf in to_triangulate:
+            if sf.identifier not in adj_check:
+                # generate the new triangulated sub-faces
+                sf_mesh3d, plane = sf.triangulated_mesh3d, sf.geometry.plane
+                mesh_verts = sf_mesh3d.vertices
+                new_sf_geo = [Face3D(tuple(mesh_verts[v] for v in face), plane)
+                              for face in sf_mesh3d.faces]
+                new_sf_geo = self._remove_sliver_geometries(new_sf_geo)
+                new_sfs, parent_edit_info = replace_function(sf, new_sf_geo)
+                triangulated_sub_faces.append(new_sfs)
                 if parent_edit_info is not None:
                     parents_to_edit.append(parent_edit_info)
-                # coordinate new doors with any adjacent doors
-                if isinstance(dr.boundary_condition, Surface):
-                    bc_obj_identifier = dr.boundary_condition.boundary_condition_object
-                    for other_dr in all_doors:
-                        if other_dr.identifier == bc_obj_identifier:
-                            adj_dr = other_dr
-                            break
-                    new_adj_dr_geo = [face.flip() for face in new_dr_geo]
-                    new_adj_drs, edit_in = self._replace_door(adj_dr, new_adj_dr_geo)
-                    for new_dr, new_adj_dr in zip(new_drs, new_adj_drs):
-                        new_dr.set_adjacency(new_adj_dr)
-                    triangulated_doors.append(new_adj_drs)
+                # coordinate new sub-faces with any adjacent sub-faces
+                sf_bc = sf._boundary_condition
+                if isinstance(sf_bc, Surface):
+                    bc_obj_identifier = sf_bc.boundary_condition_object
+                    if bc_obj_identifier == sf.identifier:
+                        continue  # self-adjacency reported by check_missing_adjacencies
+                    adj_sf = sf_dict[bc_obj_identifier]
+                    new_adj_sf_geo = [face.flip() for face in new_sf_geo]
+                    new_adj_sfs, edit_in = replace_function(adj_sf, new_adj_sf_geo)
+                    for new_sf, new_adj_sf in zip(new_sfs, new_adj_sfs):
+                        new_sf.set_adjacency(new_adj_sf)
+                    triangulated_sub_faces.append(new_adj_sfs)
                     if edit_in is not None:
                         parents_to_edit.append(edit_in)
-                    adj_check.append(adj_dr.identifier)
-        return triangulated_doors, parents_to_edit
+                    adj_check.add(adj_sf.identifier)
+        return triangulated_sub_faces, parents_to_edit
 
     def _remove_sliver_geometries(self, face3ds):
         """Remove sliver geometries from a list of Face3Ds."""
@@ -3127,31 +3051,10 @@ class Model(_Base):
                 * 2 = The identifier of the parent Room of the parent Face of the
                   original Aperture (if it exists).
         """
-        # make the new Apertures and add them to the model
-        new_aps = []
-        for i, ap_face in enumerate(new_ap_geo):
-            new_ap = Aperture('{}..{}'.format(original_ap.identifier, i),
-                              ap_face, None, original_ap.is_operable)
-            new_ap._properties = original_ap._properties  # transfer extension properties
-            if original_ap.has_parent:
-                new_ap._parent = original_ap.parent
-            new_aps.append(new_ap)
-
-        # transfer over any child shades to the first triangulated object
-        if len(original_ap._indoor_shades) != 0:
-            new_shds = [shd.duplicate() for shd in original_ap._indoor_shades]
-            new_aps[0].add_indoor_shades(new_shds)
-        if len(original_ap._outdoor_shades) != 0:
-            new_shds = [shd.duplicate() for shd in original_ap._outdoor_shades]
-            new_aps[0].add_outdoor_shades(new_shds)
-
-        # create the parent edit info
-        parent_edit_info = [original_ap.identifier]
-        if original_ap.has_parent:
-            parent_edit_info.append(original_ap.parent.identifier)
-            if original_ap.parent.has_parent:
-                parent_edit_info.append(original_ap.parent.parent.identifier)
-        return new_aps, parent_edit_info
+        ap_id, is_operable = original_ap.identifier + '..', original_ap.is_operable
+        new_aps = [Aperture(ap_id + str(i), ap_face, None, is_operable)
+                   for i, ap_face in enumerate(new_ap_geo)]
+        return new_aps, self._transfer_to_sub_faces(original_ap, new_aps)
 
     def _replace_door(self, original_dr, new_dr_geo):
         """Get new Doors generated from new_dr_geo and the properties of original_dr.
@@ -3180,30 +3083,46 @@ class Model(_Base):
                 * 2 = The identifier of the parent Room of the parent Face of the
                   original Door (if it exists).
         """
-        # make the new doors and add them to the model
-        new_drs = []
-        for i, dr_face in enumerate(new_dr_geo):
-            new_dr = Door('{}..{}'.format(original_dr.identifier, i), dr_face)
-            new_dr._properties = original_dr._properties  # transfer extension properties
-            if original_dr.has_parent:
-                new_dr._parent = original_dr.parent
-            new_drs.append(new_dr)
+        dr_id = original_dr.identifier + '..'
+        new_drs = [Door(dr_id + str(i), dr_face)
+                   for i, dr_face in enumerate(new_dr_geo)]
+        return new_drs, self._transfer_to_sub_faces(original_dr, new_drs)
+
+    @staticmethod
+    def _transfer_to_sub_faces(original, new_sub_faces):
+        """Transfer the properties, parent and shades of a sub-face to new sub-faces.
+
+        Args:
+            original: The original Aperture or Door object from which properties
+                are borrowed.
+            new_sub_faces: A list of the new Aperture or Door objects that will
+                replace the original. Any child shades of the original are
+                assigned to the first object in this list.
+
+        Returns:
+            parent_edit_info -- An array of up to 3 values meant to help edit
+            parents that have had their child faces triangulated. See
+            _replace_aperture for more information.
+        """
+        # transfer the extension properties and the parent
+        properties = original._properties
+        parent = original._parent
+        for new_sf in new_sub_faces:
+            new_sf._properties = properties
+            new_sf._parent = parent
 
         # transfer over any child shades to the first triangulated object
-        if len(original_dr._indoor_shades) != 0:
-            new_shds = [shd.duplicate() for shd in original_dr._indoor_shades]
-            new_drs[0].add_indoor_shades(new_shds)
-        if len(original_dr._outdoor_shades) != 0:
-            new_shds = [shd.duplicate() for shd in original_dr._outdoor_shades]
-            new_drs[0].add_outdoor_shades(new_shds)
+        if original._indoor_shades or original._outdoor_shades:
+            original._duplicate_child_shades(new_sub_faces[0])
 
         # create the parent edit info
-        parent_edit_info = [original_dr.identifier]
-        if original_dr.has_parent:
-            parent_edit_info.append(original_dr.parent.identifier)
-            if original_dr.parent.has_parent:
-                parent_edit_info.append(original_dr.parent.parent.identifier)
-        return new_drs, parent_edit_info
+        parent_edit_info = [original.identifier]
+        if parent is not None:
+            parent_edit_info.append(parent.identifier)
+            grandparent = parent._parent
+            if grandparent is not None:
+                parent_edit_info.append(grandparent.identifier)
+        return parent_edit_info
 
     @property
     def to(self):
@@ -3248,22 +3167,23 @@ class Model(_Base):
         base['display_name'] = self.display_name
         base['units'] = self.units
         base['properties'] = self.properties.to_dict(included_prop)
-        if self._rooms != []:
-            base['rooms'] = [r.to_dict(True, included_prop, include_plane)
-                             for r in self._rooms]
-        if self._orphaned_faces != []:
+        room_dicts = [r.to_dict(True, included_prop, include_plane)
+                      for r in self._rooms]
+        if room_dicts:
+            base['rooms'] = room_dicts
+        if self._orphaned_faces:
             base['orphaned_faces'] = [f.to_dict(True, included_prop, include_plane)
                                       for f in self._orphaned_faces]
-        if self._orphaned_apertures != []:
+        if self._orphaned_apertures:
             base['orphaned_apertures'] = [ap.to_dict(True, included_prop, include_plane)
                                           for ap in self._orphaned_apertures]
-        if self._orphaned_doors != []:
+        if self._orphaned_doors:
             base['orphaned_doors'] = [dr.to_dict(True, included_prop, include_plane)
                                       for dr in self._orphaned_doors]
-        if self._orphaned_shades != []:
+        if self._orphaned_shades:
             base['orphaned_shades'] = [shd.to_dict(True, included_prop, include_plane)
                                        for shd in self._orphaned_shades]
-        if self._shade_meshes != []:
+        if self._shade_meshes:
             base['shade_meshes'] = [sm.to_dict(True, included_prop)
                                     for sm in self._shade_meshes]
         if self.tolerance != 0:
@@ -3273,32 +3193,28 @@ class Model(_Base):
 
         # triangulate sub-faces if this was requested
         if triangulate_sub_faces:
-            apertures, parents_to_edit = self.triangulated_apertures()
-            for tri_aps, edit_infos in zip(apertures, parents_to_edit):
+            apertures, ap_parents = self.triangulated_apertures()
+            doors, dr_parents = self.triangulated_doors()
+            # index the room face dictionaries by room and face identifier
+            face_dicts = {}
+            if any(len(edit_infos) == 3 for edit_infos in chain(ap_parents, dr_parents)):
+                for room in reversed(room_dicts):
+                    for face in reversed(room['faces']):
+                        face_dicts[(room['identifier'], face['identifier'])] = face
+            for tri_aps, edit_infos in zip(apertures, ap_parents):
                 if len(edit_infos) == 3:
-                    for room in base['rooms']:
-                        if room['identifier'] == edit_infos[2]:
-                            break
-                    for face in room['faces']:
-                        if face['identifier'] == edit_infos[1]:
-                            break
+                    face = face_dicts[(edit_infos[2], edit_infos[1])]
                     for i, ap in enumerate(face['apertures']):
                         if ap['identifier'] == edit_infos[0]:
                             break
                     del face['apertures'][i]
                     face['apertures'].extend(
                         [a.to_dict(True, included_prop) for a in tri_aps])
-            doors, parents_to_edit = self.triangulated_doors()
-            for tri_drs, edit_infos in zip(doors, parents_to_edit):
+            for tri_drs, edit_infos in zip(doors, dr_parents):
                 if len(edit_infos) == 3:
-                    for room in base['rooms']:
-                        if room['identifier'] == edit_infos[2]:
-                            break
-                    for face in room['faces']:
-                        if face['identifier'] == edit_infos[1]:
-                            break
-                    for i, ap in enumerate(face['doors']):
-                        if ap['identifier'] == edit_infos[0]:
+                    face = face_dicts[(edit_infos[2], edit_infos[1])]
+                    for i, dr in enumerate(face['doors']):
+                        if dr['identifier'] == edit_infos[0]:
                             break
                     del face['doors'][i]
                     face['doors'].extend(
@@ -3411,15 +3327,9 @@ class Model(_Base):
         folder = folder if folder is not None else folders.default_simulation_folder
 
         # collect all of the Face3Ds across the model as triangles and normals
-        all_geo = []
-        for face in self.faces:
-            all_geo.append(face.punched_geometry)
-        for ap in self.apertures:
-            all_geo.append(ap.geometry)
-        for dr in self.doors:
-            all_geo.append(dr.geometry)
-        for shd in self.doors:
-            all_geo.append(shd.geometry)
+        all_geo = [face.punched_geometry for face in self.faces]
+        all_geo.extend(
+            obj.geometry for obj in chain(self.apertures, self.doors, self.shades))
 
         # convert the Face3Ds into a format for export to STL
         _face_vertices, _face_normals = [], []
@@ -3449,6 +3359,31 @@ class Model(_Base):
         return self._rooms + self._orphaned_faces + self._orphaned_shades + \
             self._orphaned_apertures + self._orphaned_doors + self._shade_meshes
 
+    @staticmethod
+    def _objects_by_identifier(objects, identifiers):
+        """Get a list of objects matching identifiers and a list of missing identifiers.
+
+        Args:
+            objects: A list of honeybee objects to be searched.
+            identifiers: A list of identifiers to be found among the objects.
+
+        Returns:
+            A tuple with two items.
+
+            -   found_objs -- A list of the objects matching the identifiers. If
+                several objects share an identifier, the first one is used.
+
+            -   missing_ids -- A list of the identifiers that were not found.
+        """
+        obj_dict = {obj.identifier: obj for obj in reversed(objects)}
+        found_objs, missing_ids = [], []
+        for obj_id in identifiers:
+            try:
+                found_objs.append(obj_dict[obj_id])
+            except KeyError:
+                missing_ids.append(obj_id)
+        return found_objs, missing_ids
+
     @staticmethod
     def validate(model, check_function='check_for_extension', check_args=None,
                  json_output=False):
@@ -3611,14 +3546,11 @@ class Model(_Base):
             messages.append(msg)
 
     @staticmethod
-    def _missing_adj_check(id_checking_function, bc_ids):
-        """Check whether adjacencies are missing from a model."""
-        try:
-            id_checking_function(bc_ids)
-            return []
-        except ValueError as e:
-            id_pattern = re.compile('\"([^"]*)\"')
-            return [obj_id for obj_id in id_pattern.findall(str(e))]
+    def _missing_adj_check(objects, bc_ids):
+        """Get a set of the adjacent object identifiers that are missing from objects.
+        """
+        obj_ids = set(obj.identifier for obj in objects)
+        return set(bc_id for bc_id in bc_ids if bc_id not in obj_ids)
 
     @staticmethod
     def _adj_objects(hb_obj):
@@ -3649,15 +3581,16 @@ class Model(_Base):
         return self
 
     def __copy__(self):
-        new_model = Model(
-            self.identifier,
-            [room.duplicate() for room in self._rooms],
-            [face.duplicate() for face in self._orphaned_faces],
-            [shade.duplicate() for shade in self._orphaned_shades],
-            [aperture.duplicate() for aperture in self._orphaned_apertures],
-            [door.duplicate() for door in self._orphaned_doors],
-            [shade_mesh.duplicate() for shade_mesh in self._shade_meshes],
-            self.units, self.tolerance, self.angle_tolerance)
+        # the objects of this model are already validated so they are copied directly
+        new_model = Model(self.identifier, units=self.units, tolerance=self.tolerance,
+                          angle_tolerance=self.angle_tolerance)
+        dup = methodcaller('duplicate')
+        new_model._rooms = list(map(dup, self._rooms))
+        new_model._orphaned_faces = list(map(dup, self._orphaned_faces))
+        new_model._orphaned_apertures = list(map(dup, self._orphaned_apertures))
+        new_model._orphaned_doors = list(map(dup, self._orphaned_doors))
+        new_model._orphaned_shades = list(map(dup, self._orphaned_shades))
+        new_model._shade_meshes = list(map(dup, self._shade_meshes))
         new_model._display_name = self._display_name
         new_model._user_data = None if self.user_data is None else self.user_data.copy()
         new_model._properties._duplicate_extension_attr(self._properties)
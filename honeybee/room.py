@@ -16,7 +16,8 @@ from .typing import float_in_range, int_in_range, clean_string, \
 from .properties import RoomProperties
 from .face import Face
 from .aperture import Aperture
-from .facetype import AirBoundary, Wall, Floor, RoofCeiling, get_type_from_normal
+from .facetype import AirBoundary, Wall, Floor, RoofCeiling, get_type_from_normal, \
+    get_types_from_normals
 from .boundarycondition import get_bc_from_position, Outdoors, Ground, Surface, \
     boundary_conditions
 from .orientation import angles_from_num_orient, orient_index
@@ -208,10 +209,12 @@ class Room(_BaseWithShade):
         """
         assert isinstance(polyface, Polyface3D), \
             'Expected ladybug_geometry Polyface3D. Got {}'.format(type(polyface))
+        face_geos = polyface.faces
+        f_types = get_types_from_normals(
+            [face.normal for face in face_geos], roof_angle, floor_angle)
         faces = []
-        for i, face in enumerate(polyface.faces):
-            faces.append(Face('{}..Face{}'.format(identifier, i), face,
-                              get_type_from_normal(face.normal, roof_angle, floor_angle),
+        for i, (face, f_type) in enumerate(zip(face_geos, f_types)):
+            faces.append(Face('{}..Face{}'.format(identifier, i), face, f_type,
                               get_bc_from_position(face.boundary, ground_depth)))
         room = cls(identifier, faces)
         room._geometry = polyface
@@ -10,6 +10,13 @@ UNITS_TOLERANCES = {
     'Inches': 0.1,
     'Centimeters': 1.0
 }
+_FACTORS_TO_METERS = {
+    'Meters': 1.0,
+    'Millimeters': 0.001,
+    'Feet': 0.3048,
+    'Inches': 0.0254,
+    'Centimeters': 0.01
+}
 
 
 def conversion_factor_to_meters(units):
@@ -29,17 +36,9 @@ def conversion_factor_to_meters(units):
         all distance units taken from Rhino geometry in order to convert
         them to meters.
     """
-    if units == 'Meters':
-        return 1.0
-    elif units == 'Millimeters':
-        return 0.001
-    elif units == 'Feet':
-        return 0.3048
-    elif units == 'Inches':
-        return 0.0254
-    elif units == 'Centimeters':
-        return 0.01
-    else:
+    try:
+        return _FACTORS_TO_METERS[units]
+    except KeyError:
         raise ValueError(
             'You are kidding me! What units are you using? {}?\n'
             'Please use one of the following: {}'.format(units, ' '.join(UNITS))
@@ -1,7 +1,7 @@
 """Test Face class."""
 from honeybee.face import Face
 from honeybee.facetype import face_types, Wall
-from honeybee.boundarycondition import boundary_conditions, Outdoors
+from honeybee.boundarycondition import boundary_conditions, Outdoors, Surface
 from honeybee.aperture import Aperture
 from honeybee.door import Door
 from honeybee.shade import Shade
@@ -153,6 +153,18 @@ def test_cardinal_direction():
     assert face_4.cardinal_direction() == 'East'
 
 
+def test_type_color():
+    """Test the Face type_color and bc_color properties."""
+    vertices = [Point3D(0, 0, 0), Point3D(0, 10, 0), Point3D(0, 10, 3), Point3D(0, 0, 3)]
+    face = Face('MyWall', Face3D(vertices))
+
+    assert face.type_color == Face.TYPE_COLORS['Wall']
+    assert face.bc_color == Face.BC_COLORS['Outdoors']
+    face.boundary_condition = Surface(('OtherWall', 'OtherRoom'))
+    assert face.type_color == Face.TYPE_COLORS['InteriorWall']
+    assert face.bc_color == Face.BC_COLORS['Surface']
+
+
 def test_face_add_prefix():
     """Test the face add_prefix method."""
     face_face3d = Face3D.from_rectangle(10, 10, Plane(o=Point3D(0, 0, 3)))
@@ -196,6 +208,7 @@ def test_add_remove_door():
 
     face.remove_doors()
     assert len(face.doors) == 0
+    assert not door.has_parent
     assert len(face.punched_vertices) == 4
     assert face.punched_geometry.area == 100
 
@@ -267,6 +280,14 @@ def test_add_remove_apertures():
     assert len(face.punched_vertices) == 4
     assert face.punched_geometry.area == 100
 
+    face.add_apertures([aperture_1])
+    assert face.punched_geometry.area == 96
+    with pytest.raises(AssertionError):
+        face.add_apertures([aperture_2, 'Not an Aperture'])
+    assert len(face.apertures) == 1
+    assert not aperture_2.has_parent
+    assert face.punched_geometry.area == 96
+
 
 def test_add_remove_sub_faces():
     """Test the adding and removing of an aperture and a door to a Face."""
@@ -323,6 +344,38 @@ def test_sub_faces_invalid():
         face.check_apertures_valid(0.01, 1)
 
 
+def test_check_sub_faces_overlapping():
+    """Test the check_sub_faces_overlapping method."""
+    face_face3d = Face3D.from_rectangle(10, 10, Plane(o=Point3D(0, 0, 3)))
+    ap_face3d_1 = Face3D.from_rectangle(2, 2, Plane(o=Point3D(1, 1, 3)))
+    ap_face3d_2 = Face3D.from_rectangle(2, 2, Plane(o=Point3D(5, 5, 3)))
+    ap_face3d_3 = Face3D.from_rectangle(2, 2, Plane(o=Point3D(2, 2, 3)))
+    face = Face('Test_Roof', face_face3d)
+    face.add_apertures([Aperture('Skylight1', ap_face3d_1),
+                        Aperture('Skylight2', ap_face3d_2)])
+    assert face.check_sub_faces_overlapping(0.01, False) == ''
+
+    face.add_aperture(Aperture('Skylight3', ap_face3d_3))
+    assert face.check_sub_faces_overlapping(0.01, False) != ''
+    with pytest.raises(ValueError):
+        face.check_sub_faces_overlapping(0.01, True)
+    detailed = face.check_sub_faces_overlapping(0.01, False, True)
+    assert len(detailed) == 1
+    assert set(detailed[0]['element_id']) == {'Skylight1', 'Skylight3'}
+
+    # check sub-faces that are slightly off of the plane of the wall
+    wall_face3d = Face3D((Point3D(0, 0, 0), Point3D(10, 0, 0),
+                          Point3D(10, 0, 10), Point3D(0, 0, 10)))
+    ap_face3d_1 = Face3D((Point3D(1, 0, 1), Point3D(3, 0, 1),
+                          Point3D(3, 0, 2), Point3D(1, 0, 2)))
+    ap_face3d_2 = Face3D((Point3D(2, 0.05, 1.5), Point3D(4, 0.05, 1.5),
+                          Point3D(4, 0.05, 2.5), Point3D(2, 0.05, 2.5)))
+    face = Face('W', wall_face3d)
+    face.add_apertures([Aperture('Window1', ap_face3d_1),
+                        Aperture('Window2', ap_face3d_2)])
+    assert face.check_sub_faces_overlapping(0.01, False) != ''
+
+
 def test_sub_faces_invalid_boundary_condition():
     """Test the adding of a sub-face to a face with invalid boundary conditions."""
     face_face3d = Face3D.from_rectangle(10, 10, Plane(o=Point3D(0, 0, 3)))
@@ -354,6 +407,11 @@ def test_sub_faces_invalid_face_type():
     with pytest.raises(AssertionError):
         face.add_door(door)
 
+    face = Face('Test_Roof', face_face3d)
+    face.add_aperture(aperture)
+    with pytest.raises(AssertionError):
+        face.type = face_types.air_boundary
+
 
 def test_apertures_by_ratio():
     """Test the adding of apertures by ratio."""
@@ -481,8 +539,10 @@ def test_move():
     face = Face('RectangleFace', Face3D(pts_1, plane_1))
 
     vec_1 = Vector3D(2, 2, 2)
+    assert face.upper_left_vertices[0] == Point3D(0, 2, 0)
     new_f = face.duplicate()
     new_f.move(vec_1)
+    assert new_f.upper_left_vertices[0] == Point3D(2, 4, 2)
     assert new_f.geometry[0] == Point3D(2, 2, 2)
     assert new_f.geometry[1] == Point3D(4, 2, 2)
     assert new_f.geometry[2] == Point3D(4, 4, 2)
@@ -492,6 +552,27 @@ def test_move():
     assert face.perimeter == new_f.perimeter
 
 
+def test_transform_punched_geometry():
+    """Test that transforms keep the punched geometry in sync with the sub-faces."""
+    face_face3d = Face3D.from_rectangle(10, 10, Plane(o=Point3D(0, 0, 3)))
+    ap_face3d = Face3D.from_rectangle(2, 2, Plane(o=Point3D(2, 2, 3)))
+    face = Face('Test_Roof', face_face3d)
+    face.add_aperture(Aperture('Test_Skylight', ap_face3d))
+    assert face.punched_geometry.area == pytest.approx(96, rel=1e-3)
+
+    face.move(Vector3D(2, 2, 2))
+    face.rotate(Vector3D(1, 0, 0), 30, Point3D(0, 0, 0))
+    face.rotate_xy(45, Point3D(1, 1, 0))
+    face.reflect(Plane(Vector3D(1, 0, 0), Point3D(0, 0, 0)))
+    face.scale(2)
+    moved_punched = face.punched_geometry
+    face._punched_geometry = None
+    fresh_punched = face.punched_geometry
+    assert moved_punched.area == pytest.approx(384, rel=1e-3)
+    assert moved_punched.center.is_equivalent(fresh_punched.center, 1e-6)
+    assert moved_punched.normal.is_equivalent(fresh_punched.normal, 1e-6)
+
+
 def test_scale():
     """Test the Face scale method."""
     pts = (Point3D(1, 1, 2), Point3D(2, 1, 2), Point3D(2, 2, 2), Point3D(1, 2, 2))
@@ -624,6 +705,29 @@ def test_remove_colinear_vertices():
     assert len(face_2.geometry.vertices) == 4
 
 
+def test_remove_degenerate_sub_faces():
+    """Test the Face remove_degenerate_sub_faces method."""
+    face_face3d = Face3D.from_rectangle(10, 10, Plane(o=Point3D(0, 0, 3)))
+    face = Face('Test_Roof', face_face3d)
+    sliver_1 = Face3D.from_rectangle(2, 0.001, Plane(o=Point3D(1, 1, 3)))
+    sliver_2 = Face3D.from_rectangle(2, 0.001, Plane(o=Point3D(1, 3, 3)))
+    valid = Face3D.from_rectangle(2, 2, Plane(o=Point3D(1, 5, 3)))
+    ap_1, ap_2 = Aperture('Sliver1', sliver_1), Aperture('Sliver2', sliver_2)
+    ap_3 = Aperture('Valid', valid)
+    sliver_3 = Face3D.from_rectangle(2, 0.001, Plane(o=Point3D(6, 1, 3)))
+    door_1 = Door('SliverDoor', sliver_3)
+    door_2 = Door('ValidDoor', Face3D.from_rectangle(2, 2, Plane(o=Point3D(6, 5, 3))))
+    face.add_apertures([ap_1, ap_2, ap_3])
+    face.add_doors([door_1, door_2])
+
+    face.remove_degenerate_sub_faces(0.01)
+    assert len(face.apertures) == 1
+    assert face.apertures[0] is ap_3
+    assert len(face.doors) == 1
+    assert face.doors[0] is door_2
+    assert not ap_1.has_parent and not door_1.has_parent
+
+
 def test_check_planar():
     """Test the check_planar method."""
     pts_1 = (Point3D(0, 0, 2), Point3D(2, 0, 2), Point3D(2, 2, 2), Point3D(0, 2, 2))
@@ -697,6 +801,22 @@ def test_to_from_dict():
     assert new_face.to_dict() == face_dict
 
 
+def test_display_dict():
+    """Test the Face display_dict method."""
+    vertices = [[0, 0, 0], [0, 10, 0], [0, 10, 3], [0, 0, 3]]
+    face = Face.from_vertices('testwall', vertices)
+    assert len(face.display_dict()) == 1
+
+    face.apertures_by_ratio(0.4, 0.01)
+    face.apertures[0].extruded_border(0.1)
+    face.louvers_by_count(2, 0.2)
+    face.add_indoor_shade(Shade('InShade', face.geometry.move(Vector3D(-0.1, 0, 0))))
+    display = face.display_dict()
+    assert len(display) == 1 + len(face.apertures) + \
+        len(face.apertures[0].shades) + len(face.shades)
+    assert all(d['type'] == 'DisplayFace3D' for d in display)
+
+
 def test_writer():
     """Test the Face writer object."""
     vertices = [[0, 0, 0], [0, 10, 0], [0, 10, 3], [0, 0, 3]]
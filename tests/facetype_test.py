@@ -1,5 +1,8 @@
 """test Face class."""
-from honeybee.facetype import Wall, RoofCeiling, Floor, AirBoundary, face_types
+from honeybee.facetype import Wall, RoofCeiling, Floor, AirBoundary, face_types, \
+    get_type_from_normal, get_types_from_normals, _FaceType
+
+from ladybug_geometry.geometry3d.pointvector import Vector3D
 
 import pytest
 
@@ -12,6 +15,8 @@ def test_wall():
     str(wall_type_1)  # test the string representation
     assert wall_type_1 == wall_type_2
     assert wall_type_1 != face_types.floor
+    assert hash(wall_type_1) == hash(wall_type_2)
+    assert len(set((wall_type_1, wall_type_2, face_types.floor))) == 2
 
 
 def test_roof_ceiling():
@@ -44,6 +49,19 @@ def test_air_boundary():
     assert air_type_1 != face_types.wall
 
 
+def test_face_type_subclass_name():
+    """Test that face types without a _name fall back to their class name."""
+    class Plenum(_FaceType):
+        __slots__ = ()
+
+    plenum_type = Plenum()
+    assert plenum_type.name == 'Plenum'
+    assert repr(plenum_type) == 'Plenum'
+    assert plenum_type == Plenum()
+    assert plenum_type != face_types.wall
+    assert face_types.wall.name == 'Wall'
+
+
 def test_face_type_by_name():
     """Test the face type by_name method."""
     assert isinstance(face_types.by_name('Wall'), Wall)
@@ -58,3 +76,25 @@ def test_face_type_by_name():
         face_types.by_name('Not_a_face_type')
     with pytest.raises(ValueError):
         face_types.by_name('walls')
+
+
+def test_get_type_from_normal():
+    """Test the get_type_from_normal function."""
+    assert isinstance(get_type_from_normal(Vector3D(0, 0, 1)), RoofCeiling)
+    assert isinstance(get_type_from_normal(Vector3D(1, 0, 0)), Wall)
+    assert isinstance(get_type_from_normal(Vector3D(0, 0, -1)), Floor)
+    assert isinstance(get_type_from_normal(Vector3D(1, 0, 1)), RoofCeiling)
+    assert isinstance(get_type_from_normal(Vector3D(1, 0, 1), 30), Wall)
+    assert isinstance(get_type_from_normal(Vector3D(1, 0, -1)), Floor)
+    assert isinstance(get_type_from_normal(Vector3D(1, 0, -1), 60, 150), Wall)
+
+
+def test_get_types_from_normals():
+    """Test the get_types_from_normals function."""
+    normals = (Vector3D(0, 0, 1), Vector3D(1, 0, 0), Vector3D(0, 0, -1),
+               Vector3D(1, 0, 1), Vector3D(1, 0, -1))
+    f_types = get_types_from_normals(normals)
+    assert f_types == [get_type_from_normal(norm) for norm in normals]
+    f_types = get_types_from_normals(normals, 30, 150)
+    assert f_types == [get_type_from_normal(norm, 30, 150) for norm in normals]
+    assert get_types_from_normals([]) == []
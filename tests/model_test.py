@@ -246,6 +246,14 @@ def test_model_init_from_objects():
     assert len(model.orphaned_apertures) == 1
     assert len(model.orphaned_doors) == 1
 
+    class CustomShade(Shade):
+        pass
+
+    sub_model = Model.from_objects('SubClass', [CustomShade('Custom', table_geo)])
+    assert len(sub_model.orphaned_shades) == 1
+    with pytest.raises(TypeError):
+        Model.from_objects('NotValid', [table_geo])
+
     model.remove_shades()
     assert len(model.shades) == 2
     model.remove_all_shades()
@@ -269,6 +277,11 @@ def test_rooms_by_identifier():
     with pytest.raises(ValueError):
         model.rooms_by_identifier(['NotARoom'])
 
+    model.remove_rooms([])
+    assert len(model.rooms) == 1
+    model.add_room(Room.from_box('TinyHouseZone2', 5, 10, 3))
+    assert len(model.rooms) == 2
+
     model.remove_rooms()
     with pytest.raises(ValueError):
         model.shades_by_identifier(['TinyHouseZone'])
@@ -797,6 +810,9 @@ def test_check_duplicate_room_identifiers():
     assert model_1.check_duplicate_room_identifiers(False) == ''
     model_1.add_model(model_2)
     assert model_1.check_duplicate_room_identifiers(False) != ''
+    err_list = model_1.check_duplicate_room_identifiers(False, True)
+    assert len(err_list) == 1
+    assert err_list[0]['element_id'] == ['Zone1']
     with pytest.raises(ValueError):
         model_1.check_duplicate_room_identifiers(True)
 
@@ -824,6 +840,10 @@ def test_check_duplicate_face_identifiers():
 
     assert model_1.check_duplicate_face_identifiers(False) == ''
     assert model_2.check_duplicate_face_identifiers(False) != ''
+    err_list = model_2.check_duplicate_face_identifiers(False, True)
+    assert len(err_list) == 1
+    assert err_list[0]['element_id'] == ['Face1']
+    assert len(err_list[0]['top_parents']) == 2
     with pytest.raises(ValueError):
         model_2.check_duplicate_face_identifiers(True)
 
@@ -900,6 +920,9 @@ def test_check_missing_adjacencies():
     with pytest.raises(ValueError):
         model_1.check_missing_adjacencies()
     assert model_1.check_missing_adjacencies(False) != ''
+    err_list = model_1.check_missing_adjacencies(False, True)
+    assert len(err_list) == 4
+    assert all(err['code'] == '000204' for err in err_list)
 
     model_1.add_model(model_2)
     assert len(model_1.rooms) == 2
@@ -1009,6 +1032,49 @@ def test_triangulated_apertures():
         assert len(ap.geometry) == 3
 
 
+def test_triangulated_apertures_adjacent():
+    """Test the triangulated_apertures method with adjacent apertures."""
+    room_south = Room.from_box('SouthZone', 5, 5, 3, origin=Point3D(0, 0, 0))
+    room_north = Room.from_box('NorthZone', 5, 5, 3, origin=Point3D(0, 5, 0))
+    aperture_verts = [Point3D(4.5, 5, 1), Point3D(2.5, 5, 1), Point3D(2.5, 5, 2.5),
+                      Point3D(3.5, 5, 2.9), Point3D(4.5, 5, 2.5)]
+    aperture_geo = Face3D(aperture_verts)
+    room_south[1].add_aperture(Aperture('SouthAperture', aperture_geo))
+    room_north[3].add_aperture(Aperture('NorthAperture', aperture_geo.flip()))
+    Room.solve_adjacency([room_south, room_north], 0.01)
+    model = Model('TinyHouse', [room_south, room_north])
+
+    triangulated_apertures, parents_to_edit = model.triangulated_apertures()
+
+    assert len(triangulated_apertures) == 2
+    assert len(parents_to_edit) == 2
+    for ap, adj_ap in zip(*triangulated_apertures):
+        assert isinstance(ap.boundary_condition, Surface)
+        assert ap.boundary_condition.boundary_condition_object == adj_ap.identifier
+        assert adj_ap.boundary_condition.boundary_condition_object == ap.identifier
+
+
+def test_to_dict_triangulate_sub_faces():
+    """Test the Model to_dict method with triangulate_sub_faces."""
+    room = Room.from_box('TinyHouseZone', 5, 10, 3)
+    north_face = room[1]
+    aperture_verts = [Point3D(4.5, 10, 1), Point3D(2.5, 10, 1), Point3D(2.5, 10, 2.5),
+                      Point3D(3.5, 10, 2.9), Point3D(4.5, 10, 2.5)]
+    north_face.add_aperture(Aperture('FrontAperture', Face3D(aperture_verts)))
+    door_verts = [Point3D(2, 10, 0.1), Point3D(1, 10, 0.1), Point3D(1, 10, 2.5),
+                  Point3D(1.5, 10, 2.8), Point3D(2, 10, 2.5)]
+    north_face.add_door(Door('FrontDoor', Face3D(door_verts)))
+    model = Model('TinyHouse', [room])
+
+    model_dict = model.to_dict(triangulate_sub_faces=True)
+    face_dict = model_dict['rooms'][0]['faces'][1]
+    assert len(face_dict['apertures']) == 3
+    assert len(face_dict['doors']) == 3
+    assert all(len(ap['geometry']['boundary']) == 3 for ap in face_dict['apertures'])
+    assert all(len(dr['geometry']['boundary']) == 3 for dr in face_dict['doors'])
+    assert len(model.to_dict()['rooms'][0]['faces'][1]['apertures']) == 1
+
+
 def test_triangulated_doors():
     """Test the triangulated_doors method."""
     room = Room.from_box('TinyHouseZone', 5, 10, 3)
@@ -1277,6 +1343,13 @@ def test_to_stl():
     assert os.path.isfile(model_stl)
     new_model = Model.from_stl(model_stl)
     assert isinstance(new_model, Model)
+    # each Face, Aperture, Door and Shade should be written once as triangles
+    assert len(model.doors) == 1
+    assert len(model.shades) == 2
+    all_geo = [f.punched_geometry for f in model.faces] + \
+        [obj.geometry for obj in model.apertures + model.doors + model.shades]
+    tri_count = sum(len(geo.triangulated_mesh3d.faces) for geo in all_geo)
+    assert len(new_model.shade_meshes[0].geometry.faces) == tri_count
     os.remove(model_stl)
 
 